@@ -65,7 +65,7 @@ class MainMenu(tk.Tk):
             self._clock_after_id = None
         
         # Check for running jobs and ask for confirmation
-        if job_manager.get_running_jobs():
+        if job_manager.has_running_jobs():
             self.log.warning("Jobs are running, asking user for confirmation to exit.")
             if messagebox.askyesno("Confirm Exit", "Jobs are currently running. Do you want to stop them and exit?"):
                 self.log.info("User confirmed to stop jobs and exit.")
@@ -83,7 +83,7 @@ class MainMenu(tk.Tk):
 
     def _shutdown_if_safe(self):
         """Checks if jobs are still running. If not, proceeds with shutdown."""
-        if job_manager.get_running_jobs():
+        if job_manager.has_running_jobs():
             self.log.info("Waiting for running jobs to terminate...")
             self.after(100, self._shutdown_if_safe) # Check again in 100ms
         else:
@@ -96,7 +96,7 @@ class MainMenu(tk.Tk):
             self.destroy()
 
     def check_jobs_and_exit(self):
-        if job_manager.get_running_jobs():
+        if job_manager.has_running_jobs():
             self.after(1000, self.check_jobs_and_exit)
         else:
             self.log.info("No running jobs. Stopping scheduler and exiting.")
@@ -4,6 +4,7 @@ from . import database
 import os
 import sqlite3
 import threading
+import queue
 from datetime import datetime, timezone, timedelta
 from . import destinations_ui
 import logging
@@ -12,6 +13,9 @@ import logging
 
 log = logging.getLogger(__name__)
 
+# How often the window applies results posted by its worker threads
+UI_QUEUE_POLL_MS = 50
+
 try:
     from tkcalendar import Calendar
 except ImportError:
@@ -43,6 +47,10 @@ class AddJobWindow(tk.Toplevel):
         self.source_size_var = tk.StringVar(value="Source Size: (select folder)")
         self.dest_space_var = tk.StringVar(value="Destination Free Space: (select destination)")
 
+        # Results from the size/space worker threads, applied to the widgets on the Tk thread
+        self._ui_queue = queue.Queue()
+        self._drain_after_id = self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         self._create_widgets()
         self._refresh_destinations()
         self._load_initial_data()
@@ -58,6 +66,23 @@ class AddJobWindow(tk.Toplevel):
         self.grab_set()
         parent.wait_window(self)
 
+    def _post(self, variable, value):
+        """Queues a variable update from a worker thread; Tk is only touched by _drain_ui_queue."""
+        self._ui_queue.put((variable, value))
+
+    def _drain_ui_queue(self):
+        while True:
+            try:
+                variable, value = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            variable.set(value)
+        self._drain_after_id = self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+    def destroy(self):
+        self.after_cancel(self._drain_after_id)
+        super().destroy()
+
     def _create_widgets(self):
         # --- Job Name ---
         tk.Label(self, text="Job Name:", bg="#f7f7f7").grid(row=0, column=0, padx=8, pady=8, sticky="w")
@@ -174,12 +199,12 @@ class AddJobWindow(tk.Toplevel):
     def _update_source_size_async(self, path):
         from .utilities_ui import get_folder_size
         try:
-            self.source_size_var.set("Source Size: Calculating...")
+            self._post(self.source_size_var, "Source Size: Calculating...")
             size_bytes = get_folder_size(path)
             size_gb = size_bytes / (1024**3)
-            self.source_size_var.set(f"Source Size: {size_gb:.2f} GB")
+            self._post(self.source_size_var, f"Source Size: {size_gb:.2f} GB")
         except Exception:
-            self.source_size_var.set(f"Source Size: Error calculating size.")
+            self._post(self.source_size_var, f"Source Size: Error calculating size.")
 
     def _on_dest_selected(self, event):
         import threading
@@ -192,10 +217,10 @@ class AddJobWindow(tk.Toplevel):
         from .google_drive_connector import GoogleDriveConnector
         
         try:
-            self.dest_space_var.set("Destination Free Space: Checking...")
+            self._post(self.dest_space_var, "Destination Free Space: Checking...")
             dest_details = self.dest_map.get(dest_name)
             if not dest_details:
-                self.dest_space_var.set("Destination Free Space: Invalid")
+                self._post(self.dest_space_var, "Destination Free Space: Invalid")
                 return
 
             provider = dest_details['provider']
@@ -206,29 +231,29 @@ class AddJobWindow(tk.Toplevel):
                 if os.path.exists(location):
                     _, _, free_space = shutil.disk_usage(location)
                 else:
-                    self.dest_space_var.set("Destination Free Space: Path does not exist")
+                    self._post(self.dest_space_var, "Destination Free Space: Path does not exist")
                     return
             elif provider == 'gdrive':
                 # The connector now gets its service from the auth_manager
                 connector = GoogleDriveConnector()
                 if not connector.is_authenticated():
-                    self.dest_space_var.set(f"Destination Free Space: {connector.get_display_name()} Auth Failed")
+                    self._post(self.dest_space_var, f"Destination Free Space: {connector.get_display_name()} Auth Failed")
                     return
                 free_space = connector.get_free_space()
             # Placeholder for other providers like onedrive
             elif provider == 'onedrive':
-                self.dest_space_var.set("Destination Free Space: OneDrive not fully implemented.")
+                self._post(self.dest_space_var, "Destination Free Space: OneDrive not fully implemented.")
                 return
 
             if free_space is not None:
                 free_gb = free_space / (1024**3)
-                self.dest_space_var.set(f"Destination Free Space: {free_gb:.2f} GB")
+                self._post(self.dest_space_var, f"Destination Free Space: {free_gb:.2f} GB")
             else:
-                self.dest_space_var.set("Destination Free Space: Could not retrieve")
+                self._post(self.dest_space_var, "Destination Free Space: Could not retrieve")
 
         except Exception as e:
             log.error(f"Error updating destination space for '{dest_name}': {e}", exc_info=True)
-            self.dest_space_var.set(f"Destination Free Space: Error")
+            self._post(self.dest_space_var, f"Destination Free Space: Error")
 
     def _select_date(self):
         if Calendar is None:
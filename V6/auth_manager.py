@@ -75,6 +75,22 @@ class _AuthManager:
         
         return self._creds and self._creds.valid
 
+    def has_cached_credentials(self):
+        """
+        Whether valid or refreshable credentials are already available, without
+        starting the interactive OAuth flow.
+        """
+        creds = self._creds
+        if not creds and os.path.exists(TOKEN_FILE):
+            try:
+                creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+            except Exception as e:
+                log.error("Failed to load credentials from %s: %s", TOKEN_FILE, e)
+                return False
+        if not creds:
+            return False
+        return creds.valid or bool(creds.expired and creds.refresh_token)
+
     def _get_service(self, service_name, version):
         """Generic method to get a Google API service object."""
         if not self._authenticate():
@@ -112,6 +128,10 @@ def get_drive_service():
     """Provides global access to the Drive service singleton."""
     return _auth_manager_instance.get_drive_service()
 
+def has_cached_credentials():
+    """Provides global access to the singleton's cached-credentials check."""
+    return _auth_manager_instance.has_cached_credentials()
+
 def get_gmail_service():
     """Provides global access to the Gmail service singleton."""
     return _auth_manager_instance.get_gmail_service()
@@ -43,6 +43,19 @@ class CloudStorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def upload_bytes(self, data: bytes, file_name: str, remote_folder: str) -> str | None:
+        """
+        Uploads an in-memory payload as a file in the specified remote folder,
+        without staging it on local disk. Intended for small payloads.
+
+        :param data: The file contents.
+        :param file_name: The name to give the remote file.
+        :param remote_folder: The name or ID of the remote folder to upload into.
+        :return: The ID of the newly created remote file, or None on failure.
+        """
+        pass
+
     @abstractmethod
     def download_file(self, remote_file_id: str, local_path: str) -> bool:
         """
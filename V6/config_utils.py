@@ -3,24 +3,45 @@ import os
 
 CONFIG_FILE = 'config.json'
 
-def save_setting(key, value):
-    """Saves a setting to the config.json file."""
+# (st_mtime_ns, st_size, config) of the last parse; reused while the file on disk is unchanged
+_config_cache = None
+
+def _load_config():
+    """Returns the parsed config, re-reading the file only when its mtime or size has changed."""
+    global _config_cache
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return {}
+    cached = _config_cache
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
     try:
         with open(CONFIG_FILE, 'r') as f:
             config = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
-        config = {}
-    
+        return {}
+    _config_cache = (st.st_mtime_ns, st.st_size, config)
+    return config
+
+def save_setting(key, value):
+    """Saves a setting to the config.json file."""
+    global _config_cache
+    config = _load_config()
+    if key in config and config[key] == value:
+        return # Already saved; leave the file alone
+
+    config = dict(config)
     config[key] = value
-    
-    with open(CONFIG_FILE, 'w') as f:
+
+    # Write a sibling file and swap it in, so a crash mid-write never leaves a truncated config
+    tmp_file = CONFIG_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
         json.dump(config, f, indent=4)
+    os.replace(tmp_file, CONFIG_FILE)
+    st = os.stat(CONFIG_FILE)
+    _config_cache = (st.st_mtime_ns, st.st_size, config)
 
 def load_setting(key):
     """Loads a setting from the config.json file."""
-    try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-            return config.get(key)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
\ No newline at end of file
+    return _load_config().get(key)
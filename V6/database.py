@@ -13,6 +13,10 @@ DB_PATH = os.path.join(BASE_DIR, "filezipper_records.db")
 
 _db_lock = threading.Lock()
 _connection = None
+# Set by _init_db once the trigram full-text index over zipped_files is in place.
+_fts_available = False
+
+_SEARCH_COLUMNS = "original_path, arcname, zip_path, file_size, mtime, compressed_size, location, description, recorded_at"
 
 def get_connection(path: str = DB_PATH) -> sqlite3.Connection:
     """Get a thread-safe database connection."""
@@ -21,8 +25,17 @@ def get_connection(path: str = DB_PATH) -> sqlite3.Connection:
         _log.info("Creating new database connection to %s", path)
         _connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
         _connection.execute("PRAGMA journal_mode=WAL;")
+        # WAL only needs fsync at checkpoints; keep temp tables, a 20 MB page cache and a 256 MB map in memory
+        _connection.execute("PRAGMA synchronous=NORMAL;")
+        _connection.execute("PRAGMA temp_store=MEMORY;")
+        _connection.execute("PRAGMA cache_size=-20000;")
+        _connection.execute("PRAGMA mmap_size=268435456;")
     return _connection
 
+def change_count(path: str = DB_PATH) -> int:
+    """Number of rows changed through the shared connection; readers compare it to detect writes."""
+    return get_connection(path).total_changes
+
 def _init_db(path: str = DB_PATH) -> None:
     """Initializes the database schema, creating tables and adding columns if they don't exist."""
     _log.info(f"Initializing database at {path}")
@@ -117,12 +130,68 @@ def _init_db(path: str = DB_PATH) -> None:
                 """
             )
 
+            _init_fts(conn)
+
             conn.commit()
             _log.info("Database initialization and migration check complete.")
         except Exception as e:
             _log.error(f"Error initializing database: {e}", exc_info=True)
             pass
 
+def _init_fts(conn: sqlite3.Connection) -> None:
+    """Create the trigram FTS5 index used by search_files, plus the triggers that keep it in sync.
+
+    The trigram tokenizer lets substring searches use the index instead of a full
+    LIKE '%...%' scan. If this SQLite build lacks FTS5/trigram, search falls back to LIKE.
+    """
+    global _fts_available
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'zipped_files_fts'"
+        ).fetchone()
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS zipped_files_fts USING fts5(
+                arcname, original_path, description,
+                content='zipped_files', content_rowid='id', tokenize='trigram'
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS zipped_files_fts_ai AFTER INSERT ON zipped_files BEGIN
+                INSERT INTO zipped_files_fts(rowid, arcname, original_path, description)
+                VALUES (new.id, new.arcname, new.original_path, new.description);
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS zipped_files_fts_ad AFTER DELETE ON zipped_files BEGIN
+                INSERT INTO zipped_files_fts(zipped_files_fts, rowid, arcname, original_path, description)
+                VALUES ('delete', old.id, old.arcname, old.original_path, old.description);
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS zipped_files_fts_au AFTER UPDATE ON zipped_files BEGIN
+                INSERT INTO zipped_files_fts(zipped_files_fts, rowid, arcname, original_path, description)
+                VALUES ('delete', old.id, old.arcname, old.original_path, old.description);
+                INSERT INTO zipped_files_fts(rowid, arcname, original_path, description)
+                VALUES (new.id, new.arcname, new.original_path, new.description);
+            END
+            """
+        )
+        if not exists:
+            # Index rows recorded before the FTS table existed.
+            conn.execute("INSERT INTO zipped_files_fts(zipped_files_fts) VALUES ('rebuild');")
+        _fts_available = True
+    except sqlite3.OperationalError as e:
+        _log.warning("Full-text search index unavailable, falling back to LIKE search: %s", e)
+        _fts_available = False
+
+
 def _record_file(
     original_path: str,
     arcname: str,
@@ -164,36 +233,67 @@ def _record_file(
             pass
 
 
+def _search_zipped_files(conn: sqlite3.Connection, columns: str, query: str, limit: int) -> sqlite3.Cursor:
+    """Run the zipped_files search selecting *columns*; shared by search_files and search_files_slim."""
+    if not query:
+        return conn.execute(
+            f"""
+            SELECT {columns}
+            FROM zipped_files
+            ORDER BY recorded_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+    if _fts_available and len(query) >= 3:
+        # Trigram index seek; quoting makes the query a literal substring phrase.
+        phrase = '"' + query.replace('"', '""') + '"'
+        return conn.execute(
+            f"""
+            SELECT {columns}
+            FROM zipped_files
+            WHERE id IN (SELECT rowid FROM zipped_files_fts WHERE zipped_files_fts MATCH ?)
+            ORDER BY recorded_at DESC
+            LIMIT ?
+            """,
+            (phrase, limit),
+        )
+    # Trigrams cannot match queries shorter than three characters.
+    like = f"%{query}%"
+    return conn.execute(
+        f"""
+        SELECT {columns}
+        FROM zipped_files
+        WHERE arcname LIKE ? OR original_path LIKE ? OR description LIKE ?
+        COLLATE NOCASE
+        ORDER BY recorded_at DESC
+        LIMIT ?
+        """,
+        (like, like, like, limit),
+    )
+
+
 def search_files(query: str, limit: int = 200, path: str = DB_PATH):
     """Search the DB for arcname/original_path/description substrings (case-insensitive). Returns rows including location and description."""
     _log.info("Searching files with query: '%s', limit: %d", query, limit)
-    like = f"%{query}%"
     with _db_lock:
         conn = get_connection(path)
         try:
-            if not query:
-                cur = conn.execute(
-                    """
-                    SELECT original_path, arcname, zip_path, file_size, mtime, compressed_size, location, description, recorded_at
-                    FROM zipped_files
-                    ORDER BY recorded_at DESC
-                    LIMIT ?
-                    """,
-                    (limit,),
-                )
-            else:
-                cur = conn.execute(
-                    """
-                    SELECT original_path, arcname, zip_path, file_size, mtime, compressed_size, location, description, recorded_at
-                    FROM zipped_files
-                    WHERE arcname LIKE ? OR original_path LIKE ? OR description LIKE ?
-                    COLLATE NOCASE
-                    ORDER BY recorded_at DESC
-                    LIMIT ?
-                    """,
-                    (like, like, like, limit),
-                )
-            rows = cur.fetchall()
+            rows = _search_zipped_files(conn, _SEARCH_COLUMNS, query, limit).fetchall()
+            _log.info("Found %d files matching query.", len(rows))
+            return rows
+        except Exception as e:
+            _log.error("Error during file search for query '%s': %s", query, e, exc_info=True)
+            return []
+
+
+def search_files_slim(query: str, limit: int = 200, path: str = DB_PATH):
+    """Same search as search_files, but returns only (arcname, zip_path, description) rows for display."""
+    _log.info("Searching files (slim) with query: '%s', limit: %d", query, limit)
+    with _db_lock:
+        conn = get_connection(path)
+        try:
+            rows = _search_zipped_files(conn, "arcname, zip_path, COALESCE(description, '')", query, limit).fetchall()
             _log.info("Found %d files matching query.", len(rows))
             return rows
         except Exception as e:
@@ -300,8 +400,16 @@ def update_job(
             pass
 
 
+# Bumped after every committed write to destinations, so readers can tell when a cached view is stale
+_destinations_version = 0
+
+def destinations_version() -> int:
+    """Number of writes made to destinations by this process."""
+    return _destinations_version
+
 def update_destination(name: str, location: str, provider: str, path: str = DB_PATH) -> None:
     """Update an existing destination in the database."""
+    global _destinations_version
     _log.info("Updating destination '%s'", name)
     with _db_lock:
         conn = get_connection(path)
@@ -316,6 +424,7 @@ def update_destination(name: str, location: str, provider: str, path: str = DB_P
                 (processed_location, provider, name),
             )
             conn.commit()
+            _destinations_version += 1
             _log.info("Successfully updated destination '%s'", name)
         except Exception as e:
             _log.error("Error updating destination '%s': %s", name, e, exc_info=True)
@@ -324,6 +433,7 @@ def update_destination(name: str, location: str, provider: str, path: str = DB_P
 
 def add_destination(name: str, location: str, provider: str, path: str = DB_PATH) -> None:
     """Add a new destination to the database."""
+    global _destinations_version
     _log.info("Adding destination '%s' at '%s' with provider '%s'", name, location, provider)
     with _db_lock:
         conn = get_connection(path)
@@ -338,6 +448,7 @@ def add_destination(name: str, location: str, provider: str, path: str = DB_PATH
                 (name, processed_location, provider),
             )
             conn.commit()
+            _destinations_version += 1
             _log.info("Successfully added destination '%s'", name)
         except Exception as e:
             _log.error("Error adding destination '%s': %s", name, e, exc_info=True)
@@ -385,12 +496,14 @@ def delete_job(job_name: str, path: str = DB_PATH) -> None:
 
 def delete_destination(name: str, path: str = DB_PATH) -> None:
     """Delete a destination from the database by name."""
+    global _destinations_version
     _log.info("Deleting destination '%s'", name)
     with _db_lock:
         conn = get_connection(path)
         try:
             conn.execute("DELETE FROM destinations WHERE name = ?", (name,))
             conn.commit()
+            _destinations_version += 1
             _log.info("Successfully deleted destination '%s'", name)
         except Exception as e:
             _log.error("Error deleting destination '%s': %s", name, e, exc_info=True)
@@ -412,7 +525,7 @@ def list_jobs(path: str = DB_PATH) -> list:
                     j.schedule_day_of_week, j.send_email_on_completion, j.recipient_email, j.destination_id
                 FROM jobs j
                 LEFT JOIN destinations d ON j.destination_id = d.id
-                ORDER BY j.created_at DESC
+                ORDER BY j.created_at DESC, j.id DESC
                 """
             )
             rows = cur.fetchall()
@@ -423,6 +536,45 @@ def list_jobs(path: str = DB_PATH) -> list:
             return []
 
 
+def iter_jobs(chunk: int = 200, path: str = DB_PATH):
+    """Yield all jobs as lists of at most `chunk` rows, in the same order and shape as list_jobs()."""
+    _log.info("Iterating jobs in chunks of %d.", chunk)
+    query = """
+        SELECT 
+            j.id, j.name, j.source_path, d.location, d.provider, j.move_files, 
+            j.created_at, j.status, j.last_run_at, j.last_run_status, j.schedule, 
+            j.next_run_at, j.schedule_hour, j.schedule_minute, j.schedule_date, 
+            j.schedule_day_of_week, j.send_email_on_completion, j.recipient_email, j.destination_id
+        FROM jobs j
+        LEFT JOIN destinations d ON j.destination_id = d.id
+        {where}
+        ORDER BY j.created_at DESC, j.id DESC
+        LIMIT ?
+        """
+    after = None  # (created_at, id) of the last row yielded
+    while True:
+        # Each page is its own query under the lock, so no cursor stays open while other threads write
+        with _db_lock:
+            conn = get_connection(path)
+            try:
+                if after is None:
+                    rows = conn.execute(query.format(where=""), (chunk,)).fetchall()
+                else:
+                    rows = conn.execute(
+                        query.format(where="WHERE j.created_at < ? OR (j.created_at = ? AND j.id < ?)"),
+                        (after[0], after[0], after[1], chunk),
+                    ).fetchall()
+            except Exception as e:
+                _log.error("Error listing jobs: %s", e, exc_info=True)
+                return
+        if not rows:
+            return
+        after = (rows[-1][6], rows[-1][0])
+        yield rows
+        if len(rows) < chunk:
+            return
+
+
 def get_job_by_name(name: str, path: str = DB_PATH):
     """Get a job from the database by name, joining with destination info."""
     _log.info("Getting job by name: '%s'", name)
@@ -453,6 +605,37 @@ def get_job_by_name(name: str, path: str = DB_PATH):
             return None
 
 
+def get_job_by_id(job_id: int, path: str = DB_PATH):
+    """Get a single job from the database by ID, in the same 19-column shape as list_jobs."""
+    _log.info("Getting job by ID: %d", job_id)
+    with _db_lock:
+        conn = get_connection(path)
+        try:
+            cur = conn.execute(
+                """
+                SELECT 
+                    j.id, j.name, j.source_path, d.location, d.provider, j.move_files, 
+                    j.created_at, j.status, j.last_run_at, j.last_run_status, j.schedule, 
+                    j.next_run_at, j.schedule_hour, j.schedule_minute, j.schedule_date, 
+                    j.schedule_day_of_week, j.send_email_on_completion, j.recipient_email, j.destination_id
+                FROM jobs j
+                LEFT JOIN destinations d ON j.destination_id = d.id
+                WHERE j.id = ?
+                LIMIT 1
+                """,
+                (job_id,),
+            )
+            row = cur.fetchone()
+            if row:
+                _log.info("Found job ID %d", job_id)
+            else:
+                _log.warning("Job ID %d not found.", job_id)
+            return row
+        except Exception as e:
+            _log.error("Error getting job ID %d: %s", job_id, e, exc_info=True)
+            return None
+
+
 def update_archive_remote_path(local_zip_path: str, remote_uri: str, path: str = DB_PATH):
     """Updates the zip_path for all records matching a local path to a new remote URI."""
     _log.info(f"Updating archive path from '{local_zip_path}' to '{remote_uri}'")
@@ -490,27 +673,23 @@ def find_duplicate_files(path: str = DB_PATH) -> dict:
     with _db_lock:
         conn = get_connection(path)
         try:
-            # First, find all arcnames that appear more than once
-            cur_dups = conn.execute(
+            # One pass: only arcnames stored in more than one archive, each (arcname, zip_path) pair once
+            cur = conn.execute(
                 """
-                SELECT arcname, COUNT(*)
+                SELECT arcname, zip_path
                 FROM zipped_files
-                GROUP BY arcname
-                HAVING COUNT(*) > 1
+                WHERE arcname IN (
+                    SELECT arcname
+                    FROM zipped_files
+                    GROUP BY arcname
+                    HAVING COUNT(DISTINCT zip_path) > 1
+                )
+                GROUP BY arcname, zip_path
+                ORDER BY arcname, zip_path
                 """
             )
-            duplicate_arcnames = [row[0] for row in cur_dups.fetchall()]
-            _log.info("Found %d potential duplicate filenames.", len(duplicate_arcnames))
-
-            # For each duplicate arcname, get all the zip paths
-            for arcname in duplicate_arcnames:
-                cur_paths = conn.execute(
-                    "SELECT zip_path FROM zipped_files WHERE arcname = ?", (arcname,)
-                )
-                # Use a set to store unique zip paths, then convert to a list
-                locations = list(set([row[0] for row in cur_paths.fetchall()]))
-                if len(locations) > 1: # Only a duplicate if in more than one location
-                    duplicates[arcname] = sorted(locations)
+            for arcname, zip_path in cur:
+                duplicates.setdefault(arcname, []).append(zip_path)
             
             _log.info("Confirmed %d files with duplicates in different locations.", len(duplicates))
             return duplicates
@@ -518,8 +697,16 @@ def find_duplicate_files(path: str = DB_PATH) -> dict:
             _log.error("Error finding duplicate files: %s", e, exc_info=True)
             return {}
 
+# Bumped on every write to restore_history; the history view compares it to spot new or updated rows
+_restore_history_version = 0
+
+def restore_history_version() -> int:
+    """Number of writes made to restore_history by this process."""
+    return _restore_history_version
+
 def add_restore_history(job_name: str, destination_path: str, start_time: str, status: str, files_restored: str, path: str = DB_PATH) -> int:
     """Add a new restore job to the history and return the new row ID."""
+    global _restore_history_version
     _log.info("Adding restore job '%s' to history.", job_name)
     with _db_lock:
         conn = get_connection(path)
@@ -532,6 +719,7 @@ def add_restore_history(job_name: str, destination_path: str, start_time: str, s
                 (job_name, destination_path, start_time, status, files_restored),
             )
             conn.commit()
+            _restore_history_version += 1
             _log.info("Successfully added restore job '%s' to history.", job_name)
             return cur.lastrowid
         except Exception as e:
@@ -540,6 +728,7 @@ def add_restore_history(job_name: str, destination_path: str, start_time: str, s
 
 def update_restore_history(restore_id: int, end_time: str, status: str, path: str = DB_PATH) -> None:
     """Update a restore job in the history with its end time and final status."""
+    global _restore_history_version
     _log.info("Updating restore job ID %d with status '%s'", restore_id, status)
     with _db_lock:
         conn = get_connection(path)
@@ -549,24 +738,27 @@ def update_restore_history(restore_id: int, end_time: str, status: str, path: st
                 (end_time, status, restore_id),
             )
             conn.commit()
+            _restore_history_version += 1
             _log.info("Successfully updated restore job ID %d.", restore_id)
         except Exception as e:
             _log.error("Error updating restore job ID %d: %s", restore_id, e, exc_info=True)
             pass
 
-def list_restore_history(path: str = DB_PATH) -> list:
-    """List all restore jobs from the history."""
-    _log.info("Listing all restore jobs from history.")
+def list_restore_history(limit: int | None = None, offset: int = 0, path: str = DB_PATH) -> list:
+    """List restore jobs from the history, newest first; pass limit/offset to fetch one page."""
+    _log.info("Listing restore jobs from history.")
     with _db_lock:
         conn = get_connection(path)
         try:
-            cur = conn.execute(
-                """
+            query = """
                 SELECT id, job_name, destination_path, status, start_time, end_time, files_restored
                 FROM restore_history
                 ORDER BY start_time DESC
                 """
-            )
+            if limit is None:
+                cur = conn.execute(query)
+            else:
+                cur = conn.execute(query + " LIMIT ? OFFSET ?", (limit, offset))
             rows = cur.fetchall()
             _log.info("Found %d restore jobs in history.", len(rows))
             return rows
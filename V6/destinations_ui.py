@@ -116,8 +116,7 @@ def open_destinations_window(root, refresh_callback=None):
     tk.Button(dest_button_frame, text="Delete Selected", command=lambda: _delete_selected_destination(dest_tree)).pack(side=tk.RIGHT)
 
     def _refresh_destinations_list(tree):
-        for i in tree.get_children():
-            tree.delete(i)
+        tree.delete(*tree.get_children())
         destinations = database.list_destinations()
         for dest in destinations:
             _, name, location, provider = dest
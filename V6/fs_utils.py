@@ -0,0 +1,2 @@
+# Windows-managed folders that appear at drive roots; they are never backed up or counted
+SKIPPED_DIR_NAMES = frozenset({'$RECYCLE.BIN', 'System Volume Information'})
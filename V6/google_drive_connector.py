@@ -4,7 +4,7 @@ import logging
 from .cloud_interface import CloudStorageProvider
 from .auth_manager import get_drive_service  # Import the central authenticator
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaInMemoryUpload, MediaIoBaseDownload
 
 log = logging.getLogger(__name__)
 
@@ -117,6 +117,31 @@ class GoogleDriveConnector(CloudStorageProvider):
             log.error(f"A non-HTTP error occurred during file upload: {e}", exc_info=True)
             return None
 
+    def upload_bytes(self, data: bytes, file_name: str, remote_folder: str) -> str | None:
+        """Uploads an in-memory payload with a single multipart request."""
+        if not self.is_authenticated():
+            log.error("Cannot upload data, service not available.")
+            return None
+
+        folder_id = self._get_folder_id(remote_folder)
+        if not folder_id:
+            return None
+
+        file_metadata = {'name': file_name, 'parents': [folder_id]}
+        try:
+            media = MediaInMemoryUpload(data, mimetype='application/octet-stream', resumable=False)
+            log.info(f"Uploading {len(data)} bytes as '{file_name}' to folder '{remote_folder}'.")
+            response = self.service.files().create(body=file_metadata, media_body=media, fields='id').execute()
+            file_id = response.get('id')
+            log.info(f"Data uploaded successfully as '{file_name}' with File ID: {file_id}")
+            return file_id
+        except HttpError as e:
+            log.error(f"An error occurred during data upload: {e}", exc_info=True)
+            return None
+        except Exception as e:
+            log.error(f"A non-HTTP error occurred during data upload: {e}", exc_info=True)
+            return None
+
     def download_file(self, remote_file_id: str, local_path: str) -> bool:
         """
         Downloads a single file from the cloud in a memory-efficient way.
@@ -1,8 +1,12 @@
 # job_manager.py
 
 import threading
+from types import MappingProxyType
 
 _running_jobs = {}
+# Read-only live view of the running jobs, keyed by job id. Listeners look up the job
+# that changed here instead of copying the whole table on every event.
+running_jobs_view = MappingProxyType(_running_jobs)
 _lock = threading.Lock()
 _listeners = []
 _root = None  # To hold a reference to the main Tkinter window
@@ -18,6 +22,11 @@ STATUS_NOTIFYING_SENDER = "Notifying Sender" # Email notification being sent
 STATUS_COMPLETED = "Completed" # All steps finished successfully
 STATUS_FAILED = "Failed" # Job encountered an unrecoverable error
 
+# Change kinds passed to listeners as listener(job_id, change)
+JOB_ADDED = "added"
+JOB_STATUS_CHANGED = "status"
+JOB_REMOVED = "removed"
+
 def set_root(root):
     """Set the root Tkinter window for safe after() calls."""
     global _root
@@ -37,20 +46,20 @@ def add_job(job_data, job_type, stop_event):
             'stop_event': stop_event,
             'status': STATUS_PENDING # Use the new constant
         }
-    _notify_listeners()
+    _notify_listeners(job_id, JOB_ADDED)
     return job_id
 
 def remove_job(job_id):
     with _lock:
         if job_id in _running_jobs:
             del _running_jobs[job_id]
-    _notify_listeners()
+    _notify_listeners(job_id, JOB_REMOVED)
 
 def update_job_status(job_id, status):
     with _lock:
         if job_id in _running_jobs:
             _running_jobs[job_id]['status'] = status
-    _notify_listeners()
+    _notify_listeners(job_id, JOB_STATUS_CHANGED)
 
 def stop_job(job_id):
     with _lock:
@@ -67,6 +76,10 @@ def get_running_jobs():
     with _lock:
         return list(_running_jobs.values())
 
+def has_running_jobs():
+    """Returns True if any job is running, without building a snapshot."""
+    return bool(_running_jobs)
+
 
 def add_listener(listener):
     if listener not in _listeners:
@@ -78,12 +91,12 @@ def remove_listener(listener):
     except ValueError:
         pass # Listener already removed
 
-def _notify_listeners():
+def _notify_listeners(job_id, change):
     if not _root:
         # If no GUI root is set, call directly (for non-GUI modes, though currently unused)
         for listener in _listeners:
             try:
-                listener()
+                listener(job_id, change)
             except Exception:
                 # In non-GUI mode, if a listener fails, we don't want to crash the scheduler
                 pass
@@ -91,4 +104,4 @@ def _notify_listeners():
 
     # Schedule the listener calls on the main GUI thread
     for listener in _listeners:
-        _root.after(0, listener)
\ No newline at end of file
+        _root.after(0, listener, job_id, change)
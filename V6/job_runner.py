@@ -27,6 +27,7 @@ from .onedrive_connector import OneDriveConnector
 from . import config_utils
 from .auth_manager import get_gmail_service # Import the central gmail service getter
 from . import station_manager
+from .fs_utils import SKIPPED_DIR_NAMES
 
 
 def send_gmail_notification(subject, body, recipient_email):
@@ -126,7 +127,8 @@ def zip_path(target_path: str, output_root: str | None = None, on_conflict_actio
     num_files = 0
     total_size = 0
     if os.path.isdir(target_path):
-        for root, _, files in os.walk(target_path):
+        for root, dirs, files in os.walk(target_path):
+            dirs[:] = [d for d in dirs if d not in SKIPPED_DIR_NAMES]
             for f in files:
                 fp = os.path.join(root, f)
                 if not os.path.islink(fp):
@@ -152,7 +154,8 @@ def zip_path(target_path: str, output_root: str | None = None, on_conflict_actio
     log.info(f"Creating zip file at: {zip_dest}")
     with zipfile.ZipFile(zip_dest, "w", zipfile.ZIP_DEFLATED) as zipf:
         if os.path.isdir(target_path):
-            for root, _, files in os.walk(target_path):
+            for root, dirs, files in os.walk(target_path):
+                dirs[:] = [d for d in dirs if d not in SKIPPED_DIR_NAMES]
                 for f in files:
                     fp = os.path.join(root, f)
                     arc = os.path.relpath(fp, start=target_path)
@@ -259,6 +262,9 @@ def run_job_in_thread(job, stop_event, on_conflict, root_widget=None, status_var
             station_manager.set_status(station_manager.SHIPPING, station_manager.COLOR_ORANGE)
             try:
                 connector = connectors[dest_provider]()
+                if root_widget and tk and hasattr(connector, "on_device_code"):
+                    # Sign-in instructions are shown from the UI thread while the upload waits
+                    connector.on_device_code = lambda message: root_widget.after(0, messagebox.showinfo, "OneDrive Sign-In", message)
                 remote_file_id = connector.upload_file(local_path=dest, remote_folder=dest_location)
             finally:
                 station_manager.set_status(station_manager.SHIPPING, station_manager.COLOR_GREEN)
@@ -337,7 +343,7 @@ def run_job_in_thread(job, stop_event, on_conflict, root_widget=None, status_var
             else:
                 refresh_callback()
 
-def run_restore_job_in_thread(job_data, stop_event, root_widget=None, refresh_callback=None):
+def run_restore_job_in_thread(job_data, stop_event, root_widget=None, refresh_callback=None, gdrive_connector=None):
     job_id = None
     restore_history_id = -1
     job_name = f"Restore to {os.path.basename(job_data.get('destination_path'))}"
@@ -385,7 +391,10 @@ def run_restore_job_in_thread(job_data, stop_event, root_widget=None, refresh_ca
                 if zip_path.startswith('gdrive://'):
                     update_status(f"Downloading {os.path.basename(zip_path)}", STATUS_TRANSFERRING) # Use new constant
                     file_id = zip_path.replace('gdrive://', '')
-                    connector = GoogleDriveConnector()
+                    # Reuse the connector the restore window already authenticated, if any
+                    if gdrive_connector is None:
+                        gdrive_connector = GoogleDriveConnector()
+                    connector = gdrive_connector
                     if not connector.authenticate():
                         raise Exception("Failed to authenticate with Google Drive.")
                     
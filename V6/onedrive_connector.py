@@ -1,4 +1,7 @@
 import os
+import sys
+import time
+import shutil
 import logging
 from .cloud_interface import CloudStorageProvider
 
@@ -9,47 +12,129 @@ except ImportError:
     msal = None
     requests = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 log = logging.getLogger(__name__)
 
 ONEDRIVE_SCOPES = ["Files.ReadWrite", "offline_access", "User.Read"]
+TOKEN_CACHE_FILE = "onedrive_token_cache.bin"
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024 # 1MB, so each downloaded chunk is at most one write syscall
+# Multiplex Graph calls over one HTTP/2 connection when httpx (with h2) is installed; otherwise use requests.
+USE_HTTP2 = True
+# Tokens this close to expiry are refreshed before use rather than risking a 401 mid-request
+TOKEN_EXPIRY_MARGIN = 5 * 60
 
 class OneDriveConnector(CloudStorageProvider):
     """A connector for interacting with Microsoft OneDrive using the MS Graph API."""
 
     def __init__(self):
         self.access_token = None
+        self._token_expires_at = 0.0  # time.time() after which access_token should be renewed
         self._ensure_deps()
+        self._app = None
+        self._token_cache = None
+        self._session, self._upload_session = self._create_sessions()
+        # Graph compresses JSON bodies on request; the HTTP client decodes them transparently.
+        self._session.headers["Accept-Encoding"] = "gzip, deflate"
+        # Optional callable(message) so a UI can show the device-code instructions.
+        self.on_device_code = None
 
     def _ensure_deps(self):
         if msal is None or requests is None:
             raise ImportError("msal and requests libraries are required for OneDrive. Please install with: pip install msal requests")
 
+    def _create_sessions(self):
+        """
+        Returns (graph_session, upload_session). The upload session never carries the
+        bearer token because upload URLs are pre-authorised and reject it.
+        """
+        self._http2 = False
+        if USE_HTTP2 and httpx is not None:
+            try:
+                limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+                sessions = tuple(
+                    httpx.Client(http2=True, limits=limits, timeout=30.0, follow_redirects=True)
+                    for _ in range(2)
+                )
+                self._http2 = True
+                return sessions
+            except ImportError:
+                # httpx without the h2 extra cannot speak HTTP/2.
+                log.info("HTTP/2 support not installed, using requests for OneDrive.")
+        return requests.Session(), requests.Session()
+
     def get_display_name(self) -> str:
         return "OneDrive"
 
-    def authenticate(self) -> bool:
+    def _get_app(self):
+        """Returns the MSAL app, creating it (and loading the token cache) only once per connector."""
+        if self._app is None:
+            client_id = os.environ.get("MSAL_CLIENT_ID")
+            if not client_id:
+                log.error("MSAL_CLIENT_ID environment variable not set.")
+                return None
+
+            # We'll leverage MSAL's token cache for persistence across sessions
+            self._token_cache = msal.SerializableTokenCache()
+            if os.path.exists(TOKEN_CACHE_FILE):
+                try:
+                    with open(TOKEN_CACHE_FILE, "rb") as fh:
+                        self._token_cache.deserialize(fh.read().decode("utf-8"))
+                except (OSError, ValueError) as e:
+                    # A corrupt cache only costs us a fresh device-code login.
+                    log.warning(f"Ignoring unreadable OneDrive token cache: {e}")
+            self._app = msal.PublicClientApplication(client_id, token_cache=self._token_cache)
+        return self._app
+
+    def _set_token(self, result) -> None:
+        self.access_token = result["access_token"]
+        if "expires_in" in result:
+            self._token_expires_at = time.time() + int(result["expires_in"])
+        else:
+            self._token_expires_at = float(result.get("expires_on", 0))
+        self._session.headers["Authorization"] = f"Bearer {self.access_token}"
+        # Save the cache every time we get a new token
+        if self._token_cache.has_state_changed:
+            with open(TOKEN_CACHE_FILE, "wb") as f:
+                f.write(self._token_cache.serialize().encode("utf-8"))
+
+    def _acquire_token_silent(self):
+        accounts = self._app.get_accounts()
+        if not accounts:
+            return None
+        log.info("Found cached account, attempting to acquire token silently.")
+        return self._app.acquire_token_silent(ONEDRIVE_SCOPES, account=accounts[0])
+
+    def _ensure_token(self) -> bool:
+        """
+        Makes sure an access token is available, preferring the in-memory token,
+        then a silent refresh from the MSAL cache, and only then the interactive device flow.
+        """
+        if self.access_token and time.time() < self._token_expires_at - TOKEN_EXPIRY_MARGIN:
+            return True
+        if self._get_app() is None:
+            return False
+        result = self._acquire_token_silent()
+        if result and "access_token" in result:
+            self._set_token(result)
+            return True
+        return self.authenticate(try_silent=False)
+
+    def authenticate(self, try_silent=True) -> bool:
         """
         Handles the authentication flow for OneDrive using MSAL's device code flow.
         Requires the MSAL_CLIENT_ID environment variable to be set.
+        Pass try_silent=False when the MSAL cache has already been tried.
         """
         log.info("Authenticating with OneDrive...")
-        client_id = os.environ.get("MSAL_CLIENT_ID")
-        if not client_id:
-            log.error("MSAL_CLIENT_ID environment variable not set.")
+        app = self._get_app()
+        if app is None:
             return False
 
-        app = msal.PublicClientApplication(client_id)
-        # We'll leverage MSAL's token cache for persistence across sessions
-        token_cache = msal.SerializableTokenCache()
-
-        if os.path.exists("onedrive_token_cache.bin"):
-            token_cache.deserialize(open("onedrive_token_cache.bin", "r").read())
-        
-        accounts = app.get_accounts()
-        result = None
-        if accounts:
-            log.info("Found cached account, attempting to acquire token silently.")
-            result = app.acquire_token_silent(ONEDRIVE_SCOPES, account=accounts[0])
+        result = self._acquire_token_silent() if try_silent else None
 
         if not result:
             log.info("No suitable token in cache, starting device code flow.")
@@ -58,20 +143,23 @@ class OneDriveConnector(CloudStorageProvider):
                 log.error(f"Failed to start device flow: {flow.get('error_description')}")
                 return False
             
-            print(flow["message"]) # Instruct user to go to a URL and enter a code
+            # Instruct user to go to a URL and enter a code
+            log.info("Device code flow: %s", flow["message"])
+            if self.on_device_code:
+                self.on_device_code(flow["message"])
+            else:
+                # No UI hooked up, so make sure the user still sees the code
+                print(flow["message"], file=sys.stderr, flush=True)
             result = app.acquire_token_by_device_flow(flow)
 
         if "access_token" in result:
-            self.access_token = result["access_token"]
-            # Save the cache every time we get a new token
-            if token_cache.has_state_changed:
-                with open("onedrive_token_cache.bin", "w") as f:
-                    f.write(token_cache.serialize())
+            self._set_token(result)
             log.info("OneDrive authentication successful.")
             return True
         else:
             log.error(f"OneDrive authentication failed: {result.get('error_description')}")
             self.access_token = None
+            self._session.headers.pop("Authorization", None)
             return False
 
     def is_authenticated(self) -> bool:
@@ -80,15 +168,13 @@ class OneDriveConnector(CloudStorageProvider):
 
     def get_free_space(self) -> int | None:
         """Returns the available free space in OneDrive in bytes."""
-        if not self.access_token:
-            if not self.authenticate():
-                return None
+        if not self._ensure_token():
+            return None
 
         try:
             log.info("Fetching OneDrive storage quota.")
-            url = "https://graph.microsoft.com/v1.0/me/drive"
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            resp = requests.get(url, headers=headers)
+            url = "https://graph.microsoft.com/v1.0/me/drive?$select=quota"
+            resp = self._session.get(url)
             resp.raise_for_status()
             data = resp.json()
             quota = data.get('quota', {})
@@ -101,8 +187,7 @@ class OneDriveConnector(CloudStorageProvider):
 
     def _create_upload_session(self, remote_path: str) -> str:
         url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{remote_path}:/createUploadSession"
-        headers = {"Authorization": f"Bearer {self.access_token}", "Content-Type": "application/json"}
-        resp = requests.post(url, headers=headers, json={"item": {"@microsoft.graph.conflictBehavior": "rename"}})
+        resp = self._session.post(url, json={"item": {"@microsoft.graph.conflictBehavior": "rename"}})
         resp.raise_for_status()
         return resp.json()["uploadUrl"]
 
@@ -116,7 +201,10 @@ class OneDriveConnector(CloudStorageProvider):
                 if not chunk: break
                 end = start + len(chunk) - 1
                 headers = {"Content-Length": str(len(chunk)), "Content-Range": f"bytes {start}-{end}/{total_size}"}
-                resp = requests.put(upload_url, headers=headers, data=chunk)
+                if self._http2:
+                    resp = self._upload_session.put(upload_url, headers=headers, content=chunk)
+                else:
+                    resp = self._upload_session.put(upload_url, headers=headers, data=chunk)
                 
                 if resp.status_code in (200, 201): # Final response
                     return resp.json()
@@ -126,9 +214,8 @@ class OneDriveConnector(CloudStorageProvider):
 
     def upload_file(self, local_path: str, remote_folder: str) -> str | None:
         """Uploads a file to OneDrive, using chunked upload for large files."""
-        if not self.access_token:
-            if not self.authenticate():
-                return None
+        if not self._ensure_token():
+            return None
         
         remote_path = f"{remote_folder}/{os.path.basename(local_path)}"
         log.info(f"Starting upload of '{local_path}' to OneDrive at '{remote_path}'")
@@ -142,23 +229,50 @@ class OneDriveConnector(CloudStorageProvider):
             log.error(f"An error occurred during OneDrive file upload: {e}")
             return None
 
+    def upload_bytes(self, data: bytes, file_name: str, remote_folder: str) -> str | None:
+        """Uploads a small in-memory payload (up to 4MB) with a single simple-upload PUT."""
+        if not self._ensure_token():
+            return None
+
+        remote_path = f"{remote_folder}/{file_name}"
+        log.info(f"Uploading {len(data)} bytes to OneDrive at '{remote_path}'")
+        try:
+            url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{remote_path}:/content"
+            if self._http2:
+                resp = self._session.put(url, content=data)
+            else:
+                resp = self._session.put(url, data=data)
+            resp.raise_for_status()
+            file_id = resp.json().get('id')
+            log.info(f"Data uploaded successfully to OneDrive with ID: {file_id}")
+            return file_id
+        except Exception as e:
+            log.error(f"An error occurred during OneDrive data upload: {e}")
+            return None
+
     def download_file(self, remote_file_id: str, local_path: str) -> bool:
         """Downloads a file from OneDrive."""
-        if not self.access_token:
-            if not self.authenticate():
-                return False
+        if not self._ensure_token():
+            return False
         
         try:
             log.info(f"Starting download of file ID '{remote_file_id}' to '{local_path}'.")
             url = f"https://graph.microsoft.com/v1.0/me/drive/items/{remote_file_id}/content"
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            
-            with requests.get(url, headers=headers, stream=True) as r:
+            if self._http2:
+                response = self._session.stream("GET", url)
+            else:
+                response = self._session.get(url, stream=True)
+            with response as r:
                 r.raise_for_status()
                 os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                with open(local_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                with open(local_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                    if self._http2:
+                        for chunk in r.iter_bytes(chunk_size=DOWNLOAD_BUFFER_SIZE):
+                            f.write(chunk)
+                    else:
+                        # Let the C-level copy loop move the bytes instead of a Python generator.
+                        r.raw.decode_content = True
+                        shutil.copyfileobj(r.raw, f, length=DOWNLOAD_BUFFER_SIZE)
             log.info(f"File '{remote_file_id}' downloaded successfully to '{local_path}'.")
             return True
         except Exception as e:
@@ -167,15 +281,13 @@ class OneDriveConnector(CloudStorageProvider):
 
     def get_remote_file_hash(self, remote_file_id: str) -> str | None:
         """Retrieves the hash (sha256) of a file in OneDrive."""
-        if not self.access_token:
-            if not self.authenticate():
-                return None
+        if not self._ensure_token():
+            return None
 
         try:
             log.info(f"Fetching hash for file ID: {remote_file_id}")
             url = f"https://graph.microsoft.com/v1.0/me/drive/items/{remote_file_id}?$select=file"
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            resp = requests.get(url, headers=headers)
+            resp = self._session.get(url)
             resp.raise_for_status()
             hashes = resp.json().get('file', {}).get('hashes', {})
             # Prefer sha256, but fall back to others if needed
@@ -190,16 +302,13 @@ class OneDriveConnector(CloudStorageProvider):
         """
         Permanently deletes a file from OneDrive.
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return False
+        if not self._ensure_token():
+            return False
 
         try:
             log.info(f"Attempting to delete file ID: {remote_file_id}")
             url = f"https://graph.microsoft.com/v1.0/me/drive/items/{remote_file_id}"
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            
-            resp = requests.delete(url, headers=headers)
+            resp = self._session.delete(url)
             resp.raise_for_status() # Will raise an exception for 4xx or 5xx status codes
             
             log.info(f"Successfully deleted file ID: {remote_file_id}")
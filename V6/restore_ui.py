@@ -4,17 +4,27 @@ from . import database
 import os
 import threading
 import zipfile
+import logging
 from .google_drive_connector import GoogleDriveConnector
+from . import auth_manager
 from . import job_runner
 from . import job_manager
 from . import run_jobs_ui
 
+log = logging.getLogger(__name__)
+
+# Rows inserted per event-loop turn so large result sets don't freeze the window
+POPULATE_BATCH_SIZE = 1000
+
 
 class RestoreWindow(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Search and Restore Files")
         self.geometry("1000x700")
+        self._populate_token = 0
+        # Set once the latest search's results are all in the tree
+        self.search_finished = threading.Event()
 
         # Main frame
         main_frame = ttk.Frame(self, padding="10")
@@ -62,6 +72,24 @@ class RestoreWindow(tk.Toplevel):
         restore_button = ttk.Button(main_frame, text="Restore Selected Files", command=self.restore_selected_files)
         restore_button.pack(pady=10)
 
+        # Authenticate in the background while the user searches, so Restore starts without the round trips
+        self._connector = None
+        threading.Thread(target=self._prewarm, daemon=True).start()
+
+    def _prewarm(self):
+        # Only warm up an existing session; opening the window must never start the browser sign-in
+        if not auth_manager.has_cached_credentials():
+            return
+        try:
+            if not any(dest[3] == 'gdrive' for dest in database.list_destinations()):
+                return
+            connector = GoogleDriveConnector()
+            if connector.is_authenticated():
+                connector.get_free_space()
+                self._connector = connector
+        except Exception as e:
+            log.warning("Could not pre-warm Google Drive connection for restore: %s", e)
+
     def toggle_checkbox(self, event):
         row_id = self.results_tree.identify_row(event.y)
         if not row_id:
@@ -75,25 +103,34 @@ class RestoreWindow(tk.Toplevel):
 
     def perform_search(self):
         query = self.search_var.get()
+        # A new search invalidates any populate still in flight for the previous one
+        self._populate_token += 1
+        self.search_finished.clear()
         # Clear previous results
-        for i in self.results_tree.get_children():
-            self.results_tree.delete(i)
+        self.results_tree.delete(*self.results_tree.get_children())
         
         # Run search in a thread to keep UI responsive
-        threading.Thread(target=self._search_thread, args=(query,), daemon=True).start()
+        threading.Thread(target=self._search_thread, args=(query, self._populate_token), daemon=True).start()
 
-    def _search_thread(self, query):
-        results = database.search_files(query)
+    def _search_thread(self, query, token):
+        results = database.search_files_slim(query)
         # Update UI from the main thread
-        self.after(0, self._populate_results, results)
+        self.after(0, self._populate_results, results, token)
 
-    def _populate_results(self, results):
-        for row in results:
-            original_path, arcname, zip_path, file_size, mtime, compressed_size, location, description, recorded_at = row
-            filename = os.path.basename(arcname)
-            description = description or ""
-            backup_set = zip_path
-            self.results_tree.insert("", "end", values=(" ", filename, description, backup_set, arcname, zip_path))
+    def _populate_results(self, results, token, start=0):
+        """Inserts one batch of results, then yields to the event loop before the next batch."""
+        if token != self._populate_token:
+            return
+        basename = os.path.basename
+        insert = self.results_tree.insert
+        end = start + POPULATE_BATCH_SIZE
+        for arcname, zip_path, description in results[start:end]:
+            # The backup set column shows the zip path.
+            insert("", "end", values=(" ", basename(arcname), description, zip_path, arcname, zip_path))
+        if end < len(results):
+            self.after(0, self._populate_results, results, token, end)
+        else:
+            self.search_finished.set()
 
     def restore_selected_files(self):
         selected_items = []
@@ -126,7 +163,7 @@ class RestoreWindow(tk.Toplevel):
         # The root window is the MainMenu instance, which is the parent of this window.
         root_widget = self.master 
         
-        thread = threading.Thread(target=job_runner.run_restore_job_in_thread, args=(job_data, stop_event, root_widget, None))
+        thread = threading.Thread(target=job_runner.run_restore_job_in_thread, args=(job_data, stop_event, root_widget, None, self._connector))
         thread.daemon = True
         thread.start()
         
@@ -137,4 +174,4 @@ class RestoreWindow(tk.Toplevel):
 
 
 def open_restore_window(parent):
-    RestoreWindow(parent)
+    return RestoreWindow(parent)
@@ -5,14 +5,68 @@ from . import job_manager
 from . import add_job_ui
 from .job_runner import run_job_in_thread, ConflictResolution
 from datetime import datetime, timezone, timedelta
+import functools
 import logging
 import threading
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .job_manager import (
+    STATUS_IDLE, STATUS_PENDING, STATUS_PACKAGING, STATUS_AWAITING_TRANSFER,
+    STATUS_TRANSFERRING, STATUS_VERIFYING, STATUS_NOTIFYING_SENDER,
+    STATUS_COMPLETED, STATUS_FAILED
+)
 
 log = logging.getLogger(__name__)
 
+# Define colors for job statuses
+STATUS_COLORS = {
+    STATUS_IDLE: '#E0E0E0',       # Light Gray
+    STATUS_PENDING: '#FFFFCC',    # Light Yellow
+    STATUS_PACKAGING: '#ADD8E6',  # Light Blue
+    STATUS_AWAITING_TRANSFER: '#FFDDC1', # Light Orange
+    STATUS_TRANSFERRING: '#90EE90', # Light Green
+    STATUS_VERIFYING: '#AFEEEE',  # Pale Turquoise
+    STATUS_NOTIFYING_SENDER: '#DDA0DD', # Plum (light purple)
+    STATUS_COMPLETED: '#CCFFCC', # Pale Green
+    STATUS_FAILED: '#FFCCCC',    # Pale Red
+    "Unknown": '#F0F0F0',         # Very Light Gray
+    "Running": '#ADD8E6',         # Light Blue
+}
+
+# Display strings for the jobs list, indexed by a boolean
+YES_NO = ("No", "Yes")
+MANUAL_SCHEDULE = "Manual"
+
+@functools.lru_cache(maxsize=4096)
+def _format_local_time(iso_timestamp):
+    """Formats a stored ISO timestamp in local time; memoized since most values repeat across refreshes."""
+    try:
+        return datetime.fromisoformat(iso_timestamp).astimezone().strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError):
+        return "N/A"
+
+_styles_configured = False
+
+def _configure_status_styles_once():
+    """Configures the shared Treeview style the first time a Run Jobs window opens."""
+    global _styles_configured
+    if _styles_configured:
+        return
+    _styles_configured = True
+    style = ttk.Style()
+    # Row tag backgrounds would otherwise hide the selection highlight.
+    selected_bg = style.lookup('Treeview', 'background', ('selected',)) or '#0078D7'
+    style.map('Treeview', background=[('selected', selected_bg)])
+
+def _configure_status_tags(tree):
+    """Colors rows of a Treeview by their status tag."""
+    for status, color in STATUS_COLORS.items():
+        tree.tag_configure(status, background=color)
+
 def open_run_jobs_window(root):
     log.info("Opening Run Jobs window...")
+    _configure_status_styles_once()
     jobs_win = tk.Toplevel(root)
     jobs_win.title("Run Jobs")
     jobs_win.geometry("1200x600")
@@ -64,46 +118,43 @@ def open_run_jobs_window(root):
     # Create and place bulb indicators
     bulb_size = 20
     bulb_padding = 5  # Padding around the bulb in the canvas
-    
-    # --- Packing Bulb ---
-    canvas_packing = tk.Canvas(bulb_frame, width=bulb_size+bulb_padding, height=bulb_size+bulb_padding, bg="lightgray", highlightthickness=0)
-    canvas_packing.create_oval(bulb_padding/2, bulb_padding/2, bulb_size, bulb_size, fill="grey", outline="black", width=1)
-    canvas_packing.grid(row=0, column=0) # Removed sticky="ew" to allow centering
-
-    # --- Scheduling Bulb ---
-    canvas_scheduling = tk.Canvas(bulb_frame, width=bulb_size+bulb_padding, height=bulb_size+bulb_padding, bg="lightgray", highlightthickness=0)
-    canvas_scheduling.create_oval(bulb_padding/2, bulb_padding/2, bulb_size, bulb_size, fill="grey", outline="black", width=1)
-    canvas_scheduling.grid(row=0, column=2)
-
-    # --- Shipping Bulb ---
-    canvas_shipping = tk.Canvas(bulb_frame, width=bulb_size+bulb_padding, height=bulb_size+bulb_padding, bg="lightgray", highlightthickness=0)
-    canvas_shipping.create_oval(bulb_padding/2, bulb_padding/2, bulb_size, bulb_size, fill="grey", outline="black", width=1)
-    canvas_shipping.grid(row=0, column=4) # Removed sticky="ew" to allow centering
-
-    # --- Notification Bulb ---
-    canvas_notification = tk.Canvas(bulb_frame, width=bulb_size+bulb_padding, height=bulb_size+bulb_padding, bg="lightgray", highlightthickness=0)
-    canvas_notification.create_oval(bulb_padding/2, bulb_padding/2, bulb_size, bulb_size, fill="grey", outline="black", width=1)
-    canvas_notification.grid(row=0, column=6) # Removed sticky="ew" to allow centering
 
     # --- Station Status Update Logic ---
     from . import station_manager
 
+    # One canvas holds all four bulbs; each oval is centred under its status label column.
+    bulb_stations = (
+        station_manager.PACKING,
+        station_manager.SCHEDULING,
+        station_manager.SHIPPING,
+        station_manager.NOTIFICATION,
+    )
+    bulbs_canvas = tk.Canvas(bulb_frame, width=len(bulb_stations)*(bulb_size+bulb_padding), height=bulb_size+bulb_padding, bg="lightgray", highlightthickness=0)
+    bulbs_canvas.grid(row=0, column=0, columnspan=7, sticky="ew")
+    bulb_items = {
+        station: bulbs_canvas.create_oval(0, 0, 0, 0, fill="grey", outline="black", width=1)
+        for station in bulb_stations
+    }
+    _last_bulb_colors = {}
+
+    def _place_bulbs(event):
+        slot_width = event.width / len(bulb_stations)
+        top = bulb_padding / 2
+        for index, station in enumerate(bulb_stations):
+            left = slot_width * (index + 0.5) - bulb_size / 2
+            bulbs_canvas.coords(bulb_items[station], left, top, left + bulb_size - bulb_padding / 2, bulb_size)
+
+    bulbs_canvas.bind("<Configure>", _place_bulbs)
+
     def _update_bulb_colors():
         """Updates the bulb colors based on the station_manager status."""
         statuses = station_manager.get_all_statuses()
-        
-        # Mapping of station names to their canvas and bulb item
-        bulb_map = {
-            station_manager.PACKING: canvas_packing,
-            station_manager.SCHEDULING: canvas_scheduling,
-            station_manager.SHIPPING: canvas_shipping,
-            station_manager.NOTIFICATION: canvas_notification,
-        }
-
-        for station, canvas in bulb_map.items():
+        for station, item in bulb_items.items():
             color = statuses.get(station, station_manager.COLOR_GREY)
-            # The oval is the first (and only) item on the canvas, so its ID is 1
-            canvas.itemconfig(1, fill=color)
+            # Only touch the canvas for bulbs whose color actually changed
+            if _last_bulb_colors.get(station) != color:
+                bulbs_canvas.itemconfig(item, fill=color)
+                _last_bulb_colors[station] = color
         log.debug("Updated bulb colors.")
 
     # --- End of Station Status Update Logic ---
@@ -114,12 +165,36 @@ def open_run_jobs_window(root):
     clock_label = tk.Label(clock_frame, font=("Arial", 12), bg="#f7f7f7")
     clock_label.pack()
 
-    jobs_win._clock_after_id = None
+    # Every pending after() id for this window, so on_close can cancel them all
+    jobs_win._after_ids = set()
+    jobs_win._closed = False
+    def _schedule(ms, fn, *args):
+        # A holder rather than a plain name: when posted from a worker, _fire can run before after() returns there
+        after_id = [None]
+        def _fire():
+            jobs_win._after_ids.discard(after_id[0])
+            if jobs_win._closed:
+                return # Posted by a worker just as the window closed
+            fn(*args)
+        after_id[0] = jobs_win.after(ms, _fire)
+        jobs_win._after_ids.add(after_id[0])
+        return after_id[0]
+
+    def _post_to_ui(fn, *args):
+        """Runs fn on the Tk thread; for worker threads, so on_close can cancel what they post."""
+        if not jobs_win._closed:
+            _schedule(0, fn, *args)
+
+    def _cancel_scheduled(after_id):
+        jobs_win._after_ids.discard(after_id)
+        jobs_win.after_cancel(after_id)
+
+    set_clock_text = clock_label.config
     def _update_clock():
-        now = datetime.now()
-        current_time = now.strftime("%Y-%m-%d %H:%M:%S")
-        clock_label.config(text=current_time)
-        jobs_win._clock_after_id = jobs_win.after(1000, _update_clock)
+        # Fixed format, so compose it directly rather than going through strftime
+        n = datetime.now()
+        set_clock_text(text=f"{n.year:04d}-{n.month:02d}-{n.day:02d} {n.hour:02d}:{n.minute:02d}:{n.second:02d}")
+        _schedule(1000, _update_clock)
 
     _update_clock()
 
@@ -138,33 +213,7 @@ def open_run_jobs_window(root):
     running_tree.column("start_time", width=150, anchor="w")
     running_tree.column("elapsed_time", width=150, anchor="w")
     running_tree.pack(fill="x", expand=True)
-
-    # Define colors for job statuses
-    from .job_manager import (
-        STATUS_IDLE, STATUS_PENDING, STATUS_PACKAGING, STATUS_AWAITING_TRANSFER, 
-        STATUS_TRANSFERRING, STATUS_VERIFYING, STATUS_NOTIFYING_SENDER, 
-        STATUS_COMPLETED, STATUS_FAILED
-    )
-
-    STATUS_COLORS = {
-        STATUS_IDLE: '#E0E0E0',       # Light Gray
-        STATUS_PENDING: '#FFFFCC',    # Light Yellow
-        STATUS_PACKAGING: '#ADD8E6',  # Light Blue
-        STATUS_AWAITING_TRANSFER: '#FFDDC1', # Light Orange
-        STATUS_TRANSFERRING: '#90EE90', # Light Green
-        STATUS_VERIFYING: '#AFEEEE',  # Pale Turquoise
-        STATUS_NOTIFYING_SENDER: '#DDA0DD', # Plum (light purple)
-        STATUS_COMPLETED: '#CCFFCC', # Pale Green
-        STATUS_FAILED: '#FFCCCC',    # Pale Red
-        "Unknown": '#F0F0F0',         # Very Light Gray
-        "Running": '#ADD8E6',         # Light Blue
-    }
-
-    # Configure tags for Treeview styling
-    style = ttk.Style()
-    for status, color in STATUS_COLORS.items():
-        style.map(f'{status}.Treeview', background=[('selected', style.lookup('Treeview', 'fieldbackground')), ('!selected', color)])
-        style.configure(f'{status}.Treeview', background=color) # For non-selected state
+    _configure_status_tags(running_tree)
 
     jobs_frame = tk.Frame(jobs_win, bg="#f7f7f7", bd=2, relief=tk.GROOVE)
     jobs_frame.pack(padx=8, pady=8, fill="both", expand=True)
@@ -208,37 +257,61 @@ def open_run_jobs_window(root):
     jobs_tree.configure(yscrollcommand=jobs_vscroll.set)
     jobs_vscroll.pack(side=tk.RIGHT, fill="y")
     jobs_tree.pack(fill="both", expand=True)
+    _configure_status_tags(jobs_tree)
+
+    # Running-tree iid -> (job_id, start_time); the 1 Hz tick only rewrites the elapsed cell of these rows
+    running_rows = {}
+
+    def _show_running_job(job_info, now):
+        job_data = job_info['data']
+        start_time = job_info['start_time']
+        status = job_info['status']
+        job_id = job_data['id']
+        iid = str(job_id)
+
+        elapsed_str = str(now - start_time).split('.')[0]
+        start_time_str = start_time.astimezone().strftime('%Y-%m-%d %H:%M:%S')
+        job_name = job_data.get('name', 'Unknown Job')
+
+        # Apply tag for coloring
+        tag = status if status in STATUS_COLORS else "Unknown"
+        values = (job_name, status, start_time_str, elapsed_str)
+        if running_tree.exists(iid):
+            running_tree.item(iid, values=values, tags=(tag,))
+        else:
+            running_tree.insert("", "end", values=values, iid=iid, tags=(tag,))
+        running_rows[iid] = (job_id, start_time)
+
+    def _on_job_event(job_id, change):
+        """job_manager listener: updates only the row of the job that changed."""
+        iid = str(job_id)
+        job_info = None if change == job_manager.JOB_REMOVED else job_manager.running_jobs_view.get(job_id)
+        if job_info is None:
+            running_rows.pop(iid, None)
+            if running_tree.exists(iid):
+                running_tree.delete(iid)
+            return
+        _show_running_job(job_info, datetime.now(timezone.utc))
 
-    _after_id = None
-    def _update_running_jobs_ui():
-        for i in running_tree.get_children():
-            running_tree.delete(i)
+    def _tick_elapsed():
         now = datetime.now(timezone.utc)
-        for job_info in job_manager.get_running_jobs():
-            job_data = job_info['data']
-            job_type = job_info['type']
-            start_time = job_info['start_time']
-            status = job_info['status']
-            job_id = job_data['id']
-
-            elapsed = now - start_time
-            elapsed_str = str(elapsed).split('.')[0]
-            start_time_str = start_time.astimezone().strftime('%Y-%m-%d %H:%M:%S')
-            
-            job_name = job_data.get('name', 'Unknown Job')
-            
-            # Apply tag for coloring
-            tag = status if status in STATUS_COLORS else "Unknown"
-            running_tree.insert("", "end", values=(job_name, status, start_time_str, elapsed_str), iid=job_id, tags=(tag,))
-        global _after_id
-        _after_id = jobs_win.after(1000, _update_running_jobs_ui)
-
-    # New function to update the Treeview on the main thread
-    def _update_jobs_treeview_gui(jobs):
-        log.debug("_update_jobs_treeview_gui: Clearing existing jobs from treeview.")
-        for i in jobs_tree.get_children():
-            jobs_tree.delete(i)
-        log.debug(f"_update_jobs_treeview_gui: Starting to insert {len(jobs)} jobs into treeview.")
+        for iid, (_, start_time) in running_rows.items():
+            running_tree.set(iid, "elapsed_time", str(now - start_time).split('.')[0])
+        _schedule(1000, _tick_elapsed)
+
+    def _set_toolbar_state(state):
+        """Enables or disables the buttons that act on the jobs list."""
+        for button in (refresh_button, run_job_button, edit_job_button, delete_job_button):
+            button.configure(state=state)
+
+    # iid -> (values, tag) currently shown in jobs_tree, so a refresh only touches rows that changed
+    shown_job_rows = {}
+    # jobs_tree iid ("job<id>") -> job id, so selection handlers never parse iids
+    jobs_win._iid_to_job = {}
+
+    # Applies one batch of fetched jobs on the main thread; Tk gets to process events between batches
+    def _update_jobs_treeview_gui(jobs, new_rows):
+        log.debug(f"_update_jobs_treeview_gui: Diffing a batch of {len(jobs)} jobs against the treeview.")
         for job in jobs:
             # Unpack the new 19-column job tuple from the JOIN query
             (job_id, name, source, dest_location, dest_provider, move_files, _, 
@@ -246,89 +319,109 @@ def open_run_jobs_window(root):
              schedule_hour, schedule_minute, schedule_date, schedule_day_of_week, 
              send_email, recipient_email, dest_id) = job
 
-            move_files_str = "Yes" if move_files == 1 else "No"
-            send_email_str = "Yes" if send_email == 1 else "No"
-            last_run_disp = datetime.fromisoformat(last_run).astimezone().strftime('%Y-%m-%d %H:%M:%S') if last_run else ""
+            last_run_disp = _format_local_time(last_run) if last_run else ""
+            next_run_at_disp = _format_local_time(next_run_at) if next_run_at else ""
             
-            next_run_at_disp = ""
-            if next_run_at:
-                try:
-                    utc_dt = datetime.fromisoformat(next_run_at)
-                    local_dt = utc_dt.astimezone()
-                    next_run_at_disp = local_dt.strftime('%Y-%m-%d %H:%M:%S')
-                except (ValueError, TypeError):
-                    next_run_at_disp = "N/A"
-            
-            display_schedule = schedule or "Manual"
-            display_day_of_week = schedule_day_of_week if schedule == "Weekly" else ""
+            dest_str = f"{dest_provider}://{dest_location}" if dest_provider and dest_location else ""
             
             # Create the values tuple for the treeview
             values = (
-                name, status or STATUS_IDLE, display_schedule, display_day_of_week, 
+                name, status or STATUS_IDLE, schedule or MANUAL_SCHEDULE,
+                schedule_day_of_week if schedule == "Weekly" else "",
                 next_run_at_disp, last_run_status or "", last_run_disp, 
-                source, f"{dest_provider}://{dest_location}", move_files_str, 
-                send_email_str, recipient_email
+                source, dest_str, YES_NO[move_files == 1],
+                YES_NO[send_email == 1], recipient_email
             )
             
             # Apply tag for coloring
             tag = status if status in STATUS_COLORS else STATUS_IDLE
-            jobs_tree.insert("", "end", values=values, iid=str(job_id), tags=(tag,))
-
-        log.debug("_update_jobs_treeview_gui: Finished inserting jobs into treeview.")
+            iid = f"job{job_id}"
+            row = (values, tag)
+            new_rows[iid] = row
+            shown = shown_job_rows.get(iid)
+            if shown is None:
+                jobs_tree.insert("", "end", values=values, iid=iid, tags=(tag,))
+                jobs_win._iid_to_job[iid] = job_id
+            elif shown != row:
+                jobs_tree.item(iid, values=values, tags=(tag,))
+
+    # Runs after the last batch: drops jobs that no longer exist and restores the database order
+    def _finish_jobs_treeview_gui(new_rows):
+        jobs_progress.stop()
+        jobs_progress.pack_forget()
+        jobs_loading_label.pack_forget()
+        for iid in shown_job_rows.keys() - new_rows.keys():
+            jobs_tree.delete(iid)
+            jobs_win._iid_to_job.pop(iid, None)
+        # Keep the database ordering (newest first) when jobs were added or removed
+        order = tuple(new_rows)
+        if jobs_tree.get_children() != order:
+            for index, iid in enumerate(order):
+                jobs_tree.move(iid, "", index)
+        shown_job_rows.clear()
+        shown_job_rows.update(new_rows)
+
+        log.debug("_finish_jobs_treeview_gui: Finished updating jobs in treeview.")
         # Restore normal button state
-        refresh_button.config(state=tk.NORMAL)
-        run_job_button.config(state=tk.NORMAL)
-        edit_job_button.config(state=tk.NORMAL)
-        delete_job_button.config(state=tk.NORMAL)
+        _set_toolbar_state(tk.NORMAL)
 
 
-    # New function to fetch jobs in a separate thread
-    def _fetch_jobs_thread_target():
-        log.debug("_fetch_jobs_thread_target: Calling database.list_jobs().")
-        jobs = database.list_jobs()
-        log.info(f"_fetch_jobs_thread_target: Found {len(jobs)} jobs in the database.")
-        # Schedule the GUI update on the main thread
-        jobs_win.after(0, _update_jobs_treeview_gui, jobs)
+    # One worker thread per window serializes the database lookups behind Refresh/Run/Edit
+    jobs_win._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jobs-db")
+
+    def _log_db_task_error(future):
+        if not future.cancelled() and future.exception():
+            log.error("Run Jobs database task failed: %s", future.exception(), exc_info=future.exception())
 
+    def _submit_db_task(fn, *args):
+        jobs_win._db_pool.submit(fn, *args).add_done_callback(_log_db_task_error)
 
+    # New function to fetch jobs on the database worker
+    def _fetch_jobs_thread_target():
+        log.debug("_fetch_jobs_thread_target: Calling database.iter_jobs().")
+        # Filled in on the main thread as the batches are applied
+        new_rows = {}
+        job_count = 0
+        for batch in database.iter_jobs():
+            job_count += len(batch)
+            # Schedule each batch on the main thread as soon as it is read
+            _post_to_ui(_update_jobs_treeview_gui, batch, new_rows)
+        log.info(f"_fetch_jobs_thread_target: Found {job_count} jobs in the database.")
+        _post_to_ui(_finish_jobs_treeview_gui, new_rows)
+
+
+    jobs_win._refresh_pending_id = None
     def _refresh_jobs_list():
+        """Schedules a refresh 50 ms out, so a burst of refresh requests costs one query and one redraw."""
+        if jobs_win._refresh_pending_id:
+            _cancel_scheduled(jobs_win._refresh_pending_id)
+        jobs_win._refresh_pending_id = _schedule(50, _really_refresh_jobs_list)
+
+    def _really_refresh_jobs_list():
+        jobs_win._refresh_pending_id = None
         log.info("Refreshing jobs list. Starting async fetch.")
         # Disable buttons to indicate loading
-        refresh_button.config(state=tk.DISABLED)
-        run_job_button.config(state=tk.DISABLED)
-        edit_job_button.config(state=tk.DISABLED)
-        delete_job_button.config(state=tk.DISABLED)
-
-        # Clear existing entries and show loading message
-        for i in jobs_tree.get_children():
-            jobs_tree.delete(i)
-        jobs_tree.insert("", "end", values=("Loading jobs...", "", "", "", "", "", "", "", "", "", "", "", ""), iid="loading")
+        _set_toolbar_state(tk.DISABLED)
+
+        # Show progress in the toolbar; the existing entries are diffed, not rebuilt, once the fetch lands
+        if not jobs_progress.winfo_manager():
+            jobs_progress.pack(side=tk.RIGHT, padx=6)
+            jobs_loading_label.pack(side=tk.RIGHT)
+            jobs_progress.start(80)
         
-        # Start fetching jobs in a separate thread
-        thread = threading.Thread(target=_fetch_jobs_thread_target)
-        thread.daemon = True # Allow the thread to exit with the main program
-        thread.start()
+        # Fetch jobs on the window's database worker
+        _submit_db_task(_fetch_jobs_thread_target)
 
     def _run_job_async_target(job_id_to_run, jobs_win_ref):
-        log.debug("_run_job_async_target: Calling database.list_jobs() to find job ID %d.", job_id_to_run)
-        all_jobs = database.list_jobs()
-        job_to_run = None
-        for job in all_jobs:
-            if job[0] == job_id_to_run:
-                job_to_run = job
-                break
+        log.debug("_run_job_async_target: Calling database.get_job_by_id() for job ID %d.", job_id_to_run)
+        job_to_run = database.get_job_by_id(job_id_to_run)
         
         # Restore button states on the main thread after fetching jobs
-        jobs_win_ref.after(0, lambda: [
-            refresh_button.config(state=tk.NORMAL),
-            run_job_button.config(state=tk.NORMAL),
-            edit_job_button.config(state=tk.NORMAL),
-            delete_job_button.config(state=tk.NORMAL)
-        ])
+        _post_to_ui(_set_toolbar_state, tk.NORMAL)
 
         if not job_to_run:
             log.error(f"Could not find job details for job ID: {job_id_to_run}")
-            jobs_win_ref.after(0, lambda: messagebox.showerror("Error", "Could not find the selected job details."))
+            _post_to_ui(messagebox.showerror, "Error", "Could not find the selected job details.")
             return
         
         # The job_to_run tuple is already in the correct format from the new DB query.
@@ -337,7 +430,7 @@ def open_run_jobs_window(root):
         job_name = job_to_run[1]
         if not os.path.exists(source_path):
             log.error(f"Source path for job '{job_name}' does not exist: {source_path}")
-            jobs_win_ref.after(0, lambda: messagebox.showerror("Error", f"Source path for job '{job_name}' does not exist:\n{source_path}"))
+            _post_to_ui(messagebox.showerror, "Error", f"Source path for job '{job_name}' does not exist:\n{source_path}")
             return
         
         log.info(f"Starting job '{job_name}' in a new thread.")
@@ -354,43 +447,28 @@ def open_run_jobs_window(root):
             log.warning("Run job triggered but no job selected.")
             messagebox.showinfo("Info", "Select a job to run.")
             return
-        job_id = int(selected_item[0])
+        job_id = jobs_win._iid_to_job[selected_item[0]]
         log.info(f"Attempting to run job with ID: {job_id}. Fetching details asynchronously.")
         
         # Disable buttons to indicate loading/processing
-        refresh_button.config(state=tk.DISABLED)
-        run_job_button.config(state=tk.DISABLED)
-        edit_job_button.config(state=tk.DISABLED)
-        delete_job_button.config(state=tk.DISABLED)
+        _set_toolbar_state(tk.DISABLED)
 
-        # Start fetching job details and running job in a separate thread
-        thread = threading.Thread(target=_run_job_async_target, args=(job_id, jobs_win))
-        thread.daemon = True
-        thread.start()
+        # Fetch job details on the database worker, which then starts the job in its own thread
+        _submit_db_task(_run_job_async_target, job_id, jobs_win)
 
     def _edit_job_async_target(job_id_to_edit, jobs_win_ref, refresh_callback_ref):
-        log.debug("_edit_job_async_target: Calling database.list_jobs() to find job ID %d.", job_id_to_edit)
-        all_jobs = database.list_jobs()
-        job_to_edit = None
-        for job in all_jobs:
-            if job[0] == job_id_to_edit:
-                job_to_edit = job
-                break
+        log.debug("_edit_job_async_target: Calling database.get_job_by_id() for job ID %d.", job_id_to_edit)
+        job_to_edit = database.get_job_by_id(job_id_to_edit)
         
         # Restore button states on the main thread after fetching jobs
-        jobs_win_ref.after(0, lambda: [
-            refresh_button.config(state=tk.NORMAL),
-            run_job_button.config(state=tk.NORMAL),
-            edit_job_button.config(state=tk.NORMAL),
-            delete_job_button.config(state=tk.NORMAL)
-        ])
+        _post_to_ui(_set_toolbar_state, tk.NORMAL)
 
         if job_to_edit:
             log.info(f"Opening 'add job' window to edit job ID: {job_id_to_edit}")
-            jobs_win_ref.after(0, lambda: add_job_ui.open_add_job_window(jobs_win_ref, job_to_edit=job_to_edit, refresh_callback=refresh_callback_ref))
+            _post_to_ui(lambda: add_job_ui.open_add_job_window(jobs_win_ref, job_to_edit=job_to_edit, refresh_callback=refresh_callback_ref))
         else:
             log.error(f"Could not find job details for editing job ID: {job_id_to_edit}")
-            jobs_win_ref.after(0, lambda: messagebox.showerror("Error", "Could not find the selected job details."))
+            _post_to_ui(messagebox.showerror, "Error", "Could not find the selected job details.")
 
 
     def _edit_selected_job():
@@ -400,19 +478,14 @@ def open_run_jobs_window(root):
             log.warning("Edit job triggered but no job selected.")
             messagebox.showinfo("Info", "Select a job to edit.")
             return
-        job_id = int(selected_item[0])
+        job_id = jobs_win._iid_to_job[selected_item[0]]
         log.info(f"Attempting to edit job with ID: {job_id}. Fetching details asynchronously.")
         
         # Disable buttons to indicate loading/processing
-        refresh_button.config(state=tk.DISABLED)
-        run_job_button.config(state=tk.DISABLED)
-        edit_job_button.config(state=tk.DISABLED)
-        delete_job_button.config(state=tk.DISABLED)
+        _set_toolbar_state(tk.DISABLED)
 
-        # Start fetching job details in a separate thread
-        thread = threading.Thread(target=_edit_job_async_target, args=(job_id, jobs_win, _refresh_jobs_list))
-        thread.daemon = True
-        thread.start()
+        # Fetch job details on the database worker
+        _submit_db_task(_edit_job_async_target, job_id, jobs_win, _refresh_jobs_list)
 
     def _delete_selected_job():
         log.info("'_delete_selected_job' triggered.")
@@ -440,7 +513,7 @@ def open_run_jobs_window(root):
             log.warning("Stop job triggered but no running job selected.")
             messagebox.showinfo("Info", "Select a running job to stop.")
             return
-        job_id = int(selected_item[0])
+        job_id = running_rows[selected_item[0]][0]
         log.info(f"Attempting to stop job with ID: {job_id}")
         job_manager.stop_job(job_id)
 
@@ -450,25 +523,27 @@ def open_run_jobs_window(root):
 
     def on_close():
         log.info("Closing Run Jobs window.")
-        if job_manager.get_running_jobs():
+        if job_manager.has_running_jobs():
             if not messagebox.askyesno("Confirm", "Jobs are currently running. Are you sure you want to exit?"):
                 log.info("User cancelled closing window due to running jobs.")
                 return
-        global _after_id
-        if _after_id:
-            jobs_win.after_cancel(_after_id)
-        if jobs_win._clock_after_id:
-            jobs_win.after_cancel(jobs_win._clock_after_id)
-            jobs_win._clock_after_id = None
-        job_manager.remove_listener(_update_running_jobs_ui)
+        jobs_win._closed = True
+        for after_id in list(jobs_win._after_ids):
+            _cancel_scheduled(after_id)
+        jobs_win._refresh_pending_id = None
+        jobs_win._db_pool.shutdown(wait=False, cancel_futures=True)
+        job_manager.remove_listener(_on_job_event)
         station_manager.remove_listener(_update_bulb_colors) # Deregister listener
         jobs_win.destroy()
 
     jobs_win.protocol("WM_DELETE_WINDOW", on_close)
-    job_manager.add_listener(_update_running_jobs_ui)
+    job_manager.add_listener(_on_job_event)
     station_manager.add_listener(_update_bulb_colors) # Register listener
     
-    _update_running_jobs_ui()
+    now = datetime.now(timezone.utc)
+    for job_info in job_manager.get_running_jobs():
+        _show_running_job(job_info, now)
+    _tick_elapsed()
     _update_bulb_colors() # Initial call to set colors
 
     tk.Button(jobs_toolbar, text="Add Job", command=lambda: add_job_ui.open_add_job_window(jobs_win, refresh_callback=_refresh_jobs_list)).pack(side=tk.LEFT, padx=6)
@@ -483,5 +558,8 @@ def open_run_jobs_window(root):
     refresh_button = tk.Button(jobs_toolbar, text="Refresh", command=_refresh_jobs_list)
     refresh_button.pack(side=tk.LEFT, padx=6)
     tk.Button(jobs_toolbar, text="Main Menu", command=on_close).pack(side=tk.RIGHT, padx=6)
+    # Packed only while a refresh is in flight
+    jobs_progress = ttk.Progressbar(jobs_toolbar, mode='indeterminate', length=80)
+    jobs_loading_label = tk.Label(jobs_toolbar, text="Loading jobs...", bg="#f7f7f7")
 
     _refresh_jobs_list()
\ No newline at end of file
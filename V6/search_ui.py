@@ -20,6 +20,7 @@ from urllib.parse import urlparse, parse_qs
 import time
 from datetime import datetime, timezone, timedelta
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 # endregion
 
@@ -56,6 +57,10 @@ except ImportError:
 # - Optional integration with Microsoft OneDrive for cloud uploads.
 # - Automatic extraction of location data from image files (if available).
 # - Graceful fallback to CLI mode if GUI components are not installed.
+#
+# Optional dependencies, each used only when installed:
+# - msal and requests (pip install msal requests) for OneDrive uploads.
+# - orjson (pip install orjson) for faster serialization of MCP responses; the json module is used otherwise.
 
 
 # Optional libs for OneDrive (MS Graph)
@@ -86,6 +91,11 @@ try:
 except Exception:
     tk = None  # GUI won't be available in headless environments
 
+try:  # Optional, see the dependency list at the top of this file
+    import orjson
+except ImportError:
+    orjson = None
+
 # Database (records each file added to archives)
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 DB_PATH = os.path.join(BASE_DIR, "filezipper_records.db")
@@ -99,6 +109,53 @@ DB_PATH = os.path.join(BASE_DIR, "filezipper_records.db")
 
 # ---------- Model Context Protocol (MCP) over HTTP Server ----------
 MCP_PORT = 8999
+# Responses are reused for this long unless the database has been written to in the meantime
+MCP_CACHE_TTL = 1.0
+
+_mcp_cache = {}  # (path, query) -> (timestamp, database change count, serialized body)
+_mcp_inflight = {}  # (path, query) -> Future of the load currently building that body
+_mcp_cache_lock = threading.Lock()
+# Loads and serializes cache misses; concurrent requests for the same key share one load
+_mcp_loader_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mcp-load")
+MCP_LOAD_TIMEOUT = 30.0
+
+def _load_into_cache(key, loader, changes):
+    try:
+        data = loader()
+        with _mcp_cache_lock:
+            if len(_mcp_cache) >= 256:
+                _mcp_cache.clear()  # Every distinct /files search adds a key; keep the cache bounded
+            _mcp_cache[key] = (time.monotonic(), changes, data)
+        return data
+    finally:
+        with _mcp_cache_lock:
+            _mcp_inflight.pop(key, None)
+
+def _cached_query(key, loader):
+    """Returns loader()'s serialized result, reusing a recent one if no database write happened since."""
+    now = time.monotonic()
+    changes = database.change_count()
+    with _mcp_cache_lock:
+        cached = _mcp_cache.get(key)
+        if cached and now - cached[0] < MCP_CACHE_TTL and cached[1] == changes:
+            return cached[2]
+        future = _mcp_inflight.get(key)
+        if future is None:
+            future = _mcp_loader_pool.submit(_load_into_cache, key, loader, changes)
+            _mcp_inflight[key] = future
+    return future.result(timeout=MCP_LOAD_TIMEOUT)
+
+def _dumps(data) -> bytes:
+    """Serializes a response body, with orjson when it is installed."""
+    # Use a custom default to handle non-serializable types like datetime
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+class MCPServer(socketserver.ThreadingTCPServer):
+    """Serves each MCP connection on its own thread so slow clients don't block each other."""
+    daemon_threads = True
+    allow_reuse_address = True
 
 class MCPRequestHandler(http.server.BaseHTTPRequestHandler):
     """Handles HTTP requests for the Model Context Protocol."""
@@ -112,14 +169,14 @@ class MCPRequestHandler(http.server.BaseHTTPRequestHandler):
         try:
             if path == '/files':
                 search_query = query_params.get('search', [''])[0]
-                data = database.search_files(search_query)
-                self.send_json_response(data)
+                body = _cached_query((path, search_query), lambda: _dumps(database.search_files(search_query)))
+                self.send_json_body(body)
             elif path == '/jobs':
-                data = database.list_jobs()
-                self.send_json_response(data)
+                body = _cached_query((path, None), lambda: _dumps(database.list_jobs()))
+                self.send_json_body(body)
             elif path == '/destinations':
-                data = database.list_destinations()
-                self.send_json_response(data)
+                body = _cached_query((path, None), lambda: _dumps(database.list_destinations()))
+                self.send_json_body(body)
             else:
                 self.send_error(404, "Not Found")
         except Exception as e:
@@ -127,12 +184,15 @@ class MCPRequestHandler(http.server.BaseHTTPRequestHandler):
 
     def send_json_response(self, data, status_code=200):
         """Sends a JSON response."""
+        self.send_json_body(_dumps(data), status_code)
+
+    def send_json_body(self, body, status_code=200):
+        """Sends an already serialized JSON body."""
         self.send_response(status_code)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        # Use a custom default to handle non-serializable types like datetime
-        json_str = json.dumps(data, indent=2, default=str).encode('utf-8')
-        self.wfile.write(json_str)
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         """Suppress HTTP server logging to keep the console clean."""
@@ -141,7 +201,7 @@ class MCPRequestHandler(http.server.BaseHTTPRequestHandler):
 def start_mcp_server(port=MCP_PORT):
     """Starts the MCP HTTP server in a separate thread."""
     def run_server():
-        with socketserver.TCPServer(("", port), MCPRequestHandler) as httpd:
+        with MCPServer(("", port), MCPRequestHandler) as httpd:
             # This print is useful for confirming the server started.
             print(f"MCP server running on http://localhost:{port}")
             httpd.serve_forever()
@@ -1,115 +1,205 @@
+import io
 import os
 import zipfile
 import logging
+import threading
+import functools
+from collections import namedtuple
+import time
+from concurrent.futures import ThreadPoolExecutor
 from . import database
-from .google_drive_connector import GoogleDriveConnector
-from .onedrive_connector import OneDriveConnector
+from . import station_manager
 
 log = logging.getLogger(__name__)
 
-def test_packing(temp_dir="."):
+def _healthcheck_level():
+    """Returns the deflate level from ZIPPER_HEALTHCHECK_LEVEL, or None when unset or invalid."""
+    value = os.environ.get("ZIPPER_HEALTHCHECK_LEVEL")
+    if not value:
+        return None
+    try:
+        level = int(value)
+    except ValueError:
+        level = -1
+    if not 0 <= level <= 9:
+        log.warning("Ignoring ZIPPER_HEALTHCHECK_LEVEL=%r; expected a whole number from 0 to 9.", value)
+        return None
+    return level
+
+# Set ZIPPER_HEALTHCHECK_LEVEL (0-9) to have the packing check exercise deflate at that level
+# instead of storing; 1 (zlib.Z_BEST_SPEED) keeps the check cheap while still running zlib.
+HEALTHCHECK_COMPRESSLEVEL = _healthcheck_level()
+
+def test_packing(temp_dir=".", keep_on_disk=False):
     """
-    Tests the packing functionality by creating and then deleting a small zip file.
+    Tests the packing functionality by building a small zip archive in memory.
+
+    Args:
+        keep_on_disk (bool): Also write the archive to temp_dir and remove it again,
+            to check that the directory is writable.
 
     Returns:
-        bool: True if the zip file was created and deleted successfully, False otherwise.
+        bool: True if the zip archive was created successfully, False otherwise.
     """
     log.info("Running packing station check...")
-    test_file_name = os.path.join(temp_dir, "packing_test_file.txt")
     zip_file_name = os.path.join(temp_dir, "packing_test.zip")
 
     try:
-        # 1. Create a dummy file to be zipped
-        log.debug(f"Creating dummy file: {test_file_name}")
-        with open(test_file_name, "w") as f:
-            f.write("This is a test.")
-
-        # 2. Create the zip archive
-        log.debug(f"Creating zip file: {zip_file_name}")
-        with zipfile.ZipFile(zip_file_name, 'w', zipfile.ZIP_DEFLATED) as zf:
-            zf.write(test_file_name, os.path.basename(test_file_name))
-
-        # 3. Verify the zip file exists
-        if not os.path.exists(zip_file_name):
-            raise IOError("Zip file was not created.")
+        # 1. Create the zip archive from a constant payload, without a dummy file on disk
+        log.debug("Creating in-memory zip archive")
+        buffer = io.BytesIO()
+        # A 15-byte payload only grows under deflate, so store it unless a deflate level is asked for
+        if HEALTHCHECK_COMPRESSLEVEL is None:
+            zf = zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED)
+        else:
+            zf = zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=HEALTHCHECK_COMPRESSLEVEL)
+        with zf:
+            zf.writestr("packing_test_file.txt", b"This is a test.")
+
+        # 2. Verify the archive reads back
+        with zipfile.ZipFile(buffer) as zf:
+            if zf.testzip() is not None:
+                raise IOError("Zip archive is corrupt.")
+
+        # 3. Optionally verify it can be written to disk
+        if keep_on_disk:
+            log.debug("Writing zip file: %s", zip_file_name)
+            data = buffer.getvalue()
+            with open(zip_file_name, "wb") as f:
+                f.write(data)
+            # One stat both proves the file exists and that it was written in full
+            if os.path.getsize(zip_file_name) != len(data):
+                raise IOError("Zip file was not written completely.")
         
         log.info("Packing station check successful.")
         return True
 
     except Exception as e:
-        log.error(f"Packing station check failed: {e}", exc_info=True)
+        log.error("Packing station check failed: %s", e, exc_info=True)
         return False
 
     finally:
         # 4. Clean up created files
-        if os.path.exists(test_file_name):
-            log.debug(f"Cleaning up dummy file: {test_file_name}")
-            os.remove(test_file_name)
-        if os.path.exists(zip_file_name):
-            log.debug(f"Cleaning up zip file: {zip_file_name}")
-            os.remove(zip_file_name)
-
-def test_shipping(temp_dir="."):
+        if keep_on_disk:
+            log.debug("Cleaning up zip file: %s", zip_file_name)
+            try:
+                os.unlink(zip_file_name)
+            except FileNotFoundError:
+                pass
+
+# Uploaded straight from memory by the shipping check, so no local file is written
+SHIPPING_TEST_FILE_NAME = "shipping_test_file.txt"
+SHIPPING_TEST_PAYLOAD = b"This is a shipping test file."
+
+# Named view of the (id, name, location, provider) rows returned by database.list_destinations()
+Destination = namedtuple('Destination', 'id name location provider')
+
+@functools.lru_cache(maxsize=None)
+def _load_connectors():
+    """
+    Imports the cloud connector classes on first use, so packing-only callers
+    don't pay for loading the Google API client and msal.
+    """
+    from .google_drive_connector import GoogleDriveConnector
+    from .onedrive_connector import OneDriveConnector
+    connector_factories = (
+        ('gdrive', GoogleDriveConnector),
+        ('onedrive', OneDriveConnector),
+    )
+    return dict(connector_factories)
+# Authenticated connectors are kept between shipping checks and rebuilt after this many seconds
+CONNECTOR_TTL = 30 * 60
+
+_connector_cache = {}  # provider -> (created_at, connector)
+_connector_lock = threading.Lock()
+
+def _get_connector(provider):
+    """Returns a cached connector for the provider, creating a new one if none is fresh."""
+    with _connector_lock:
+        cached = _connector_cache.get(provider)
+        if cached and time.monotonic() - cached[0] < CONNECTOR_TTL:
+            return cached[1]
+        connector = _load_connectors()[provider]()
+        _connector_cache[provider] = (time.monotonic(), connector)
+        return connector
+
+def _probe_destination(dest):
+    """
+    Uploads the in-memory test payload to one destination and deletes it again.
+
+    Returns:
+        tuple: (destination name, True if the upload succeeded, error message or None).
+    """
+    dest_name, dest_location, dest_provider = dest.name, dest.location, dest.provider
+    log.info("Testing destination '%s' (%s)...", dest_name, dest_provider)
+    connector = None
+    remote_file_id = None
+    try:
+        connector = _get_connector(dest_provider)
+
+        # Upload the file
+        log.debug("Uploading test file to '%s'", dest_location)
+        remote_file_id = connector.upload_bytes(SHIPPING_TEST_PAYLOAD, SHIPPING_TEST_FILE_NAME, dest_location)
+        if not remote_file_id:
+            log.error("Upload to '%s' failed.", dest_name)
+            return dest_name, False, "upload failed"
+        log.info("Upload to '%s' successful, file ID: %s", dest_name, remote_file_id)
+        return dest_name, True, None
+
+    except Exception as e:
+        log.error("An error occurred during test for destination '%s': %s", dest_name, e, exc_info=True)
+        return dest_name, False, str(e)
+    finally:
+        # Clean up the remote file
+        if remote_file_id:
+            log.debug("Deleting remote test file: %s", remote_file_id)
+            if not connector.delete_file(remote_file_id):
+                log.warning("Failed to delete remote test file '%s' from '%s'. Manual cleanup may be required.", remote_file_id, dest_name)
+                # We don't fail the check here, as the core functionality worked, but we log a stern warning.
+
+def test_shipping():
     """
     Tests the shipping functionality by uploading and deleting a test file
-    to all configured cloud destinations.
+    to all configured cloud destinations. Providers are probed concurrently,
+    since each probe is dominated by network round trips; destinations of the
+    same provider share one cached connector and are probed in turn.
 
     Returns:
         bool: True if all destinations were tested successfully, False otherwise.
     """
     log.info("Running shipping station check...")
-    connectors = {
-        'gdrive': GoogleDriveConnector,
-        'onedrive': OneDriveConnector
-    }
-    
-    try:
-        destinations = database.list_destinations()
-    except Exception as e:
-        log.error(f"Could not retrieve destinations from database: {e}", exc_info=True)
-        return False
+    version = database.destinations_version()
+    if station_manager.has_cloud_destinations(version) is False:
+        log.info("No cloud destinations configured. Shipping check skipped.")
+        return True # Nothing to test, and no destination has been written since we last looked
+
+    rows = database.list_destinations()
+    # list_destinations() returns [] on a database error too, so only a non-empty listing is cached
+    if rows:
+        station_manager.update_cloud_destinations(rows, version)
+    destinations = [Destination(*d[:4]) for d in rows]
 
-    cloud_destinations = [d for d in destinations if d[3] in connectors]
+    cloud_destinations = [d for d in destinations if d.provider in station_manager.CLOUD_PROVIDERS]
 
     if not cloud_destinations:
         log.info("No cloud destinations configured. Shipping check skipped.")
         return True # Nothing to test
 
-    test_file_name = os.path.join(temp_dir, "shipping_test_file.txt")
-    try:
-        # Create a dummy file for uploading
-        with open(test_file_name, "w") as f:
-            f.write("This is a shipping test file.")
+    by_provider = {}
+    for dest in cloud_destinations:
+        by_provider.setdefault(dest.provider, []).append(dest)
 
-        for dest_id, dest_name, dest_location, dest_provider in cloud_destinations:
-            log.info(f"Testing destination '{dest_name}' ({dest_provider})...")
-            remote_file_id = None
-            try:
-                connector = connectors[dest_provider]()
-                
-                # Upload the file
-                log.debug(f"Uploading test file to '{dest_location}'")
-                remote_file_id = connector.upload_file(test_file_name, dest_location)
-                if not remote_file_id:
-                    log.error(f"Upload to '{dest_name}' failed.")
-                    return False
-                log.info(f"Upload to '{dest_name}' successful, file ID: {remote_file_id}")
-
-            except Exception as e:
-                log.error(f"An error occurred during test for destination '{dest_name}': {e}", exc_info=True)
-                return False
-            finally:
-                # Clean up the remote file
-                if remote_file_id:
-                    log.debug(f"Deleting remote test file: {remote_file_id}")
-                    if not connector.delete_file(remote_file_id):
-                        log.warning(f"Failed to delete remote test file '{remote_file_id}' from '{dest_name}'. Manual cleanup may be required.")
-                        # We don't return False here, as the core functionality worked, but we log a stern warning.
-    
-    finally:
-        # Clean up the local dummy file
-        if os.path.exists(test_file_name):
-            os.remove(test_file_name)
+    def probe_provider(dests):
+        return [_probe_destination(dest) for dest in dests]
+
+    with ThreadPoolExecutor(max_workers=len(by_provider)) as executor:
+        results = [result for group in executor.map(probe_provider, by_provider.values()) for result in group]
+
+    failed = [(name, err) for name, ok, err in results if not ok]
+    if failed:
+        for name, err in failed:
+            log.error("Shipping check failed for destination '%s': %s", name, err)
+        return False
 
     log.info("Shipping station check fully successful for all destinations.")
     return True
@@ -1,4 +1,6 @@
 import logging
+import threading
+from types import MappingProxyType
 
 log = logging.getLogger(__name__)
 
@@ -15,15 +17,29 @@ COLOR_ORANGE = 'orange'
 COLOR_RED = 'red'
 COLOR_YELLOW = 'yellow'
 
+# Destination providers the shipping station uploads to
+CLOUD_PROVIDERS = ('gdrive', 'onedrive')
+
+class _Stations:
+    """Fixed-layout status storage: one slot per station, named after the station constants."""
+    __slots__ = (PACKING, SCHEDULING, SHIPPING, NOTIFICATION)
+
+    def __init__(self):
+        for station in self.__slots__:
+            setattr(self, station, COLOR_GREY)
+
+    def as_dict(self):
+        return {station: getattr(self, station) for station in self.__slots__}
+
 # Initialize the status of all stations
-_station_statuses = {
-    PACKING: COLOR_GREY,
-    SCHEDULING: COLOR_GREY,
-    SHIPPING: COLOR_GREY,
-    NOTIFICATION: COLOR_GREY,
-}
+_stations = _Stations()
 
-_listeners = []
+# Read-only snapshot handed out by get_all_statuses; replaced, never mutated, on each change
+_status_snapshot = MappingProxyType(_stations.as_dict())
+_status_lock = threading.Lock()
+
+# A tuple swapped on add/remove, so notifying can iterate it without copying or locking
+_listeners = ()
 
 def _notify_listeners():
     """Notify all registered listeners of a status change."""
@@ -31,19 +47,21 @@ def _notify_listeners():
         try:
             listener()
         except Exception as e:
-            log.error(f"Error notifying a station status listener: {e}", exc_info=True)
+            log.error("Error notifying a station status listener: %s", e, exc_info=True)
 
 def add_listener(listener_func):
     """Add a listener function to be called on status changes."""
+    global _listeners
     if listener_func not in _listeners:
-        _listeners.append(listener_func)
-        log.debug(f"Added station status listener: {listener_func.__name__}")
+        _listeners = _listeners + (listener_func,)
+        log.debug("Added station status listener: %s", listener_func.__name__)
 
 def remove_listener(listener_func):
     """Remove a listener function."""
+    global _listeners
     if listener_func in _listeners:
-        _listeners.remove(listener_func)
-        log.debug(f"Removed station status listener: {listener_func.__name__}")
+        _listeners = tuple(l for l in _listeners if l != listener_func)
+        log.debug("Removed station status listener: %s", listener_func.__name__)
 
 def set_status(station, color):
     """
@@ -53,13 +71,18 @@ def set_status(station, color):
         station (str): The name of the station (e.g., PACKING).
         color (str): The color to set (e.g., COLOR_GREEN).
     """
-    if station in _station_statuses:
-        if _station_statuses[station] != color:
-            _station_statuses[station] = color
-            log.info(f"Station '{station}' status changed to '{color}'.")
+    global _status_snapshot
+    if station in _Stations.__slots__:
+        with _status_lock:
+            changed = getattr(_stations, station) != color
+            if changed:
+                setattr(_stations, station, color)
+                _status_snapshot = MappingProxyType(_stations.as_dict())
+        if changed:
+            log.info("Station '%s' status changed to '%s'.", station, color)
             _notify_listeners()
     else:
-        log.warning(f"Attempted to set status for unknown station: {station}")
+        log.warning("Attempted to set status for unknown station: %s", station)
 
 def get_status(station):
     """
@@ -71,8 +94,23 @@ def get_status(station):
     Returns:
         str: The current color status, or COLOR_GREY if station is unknown.
     """
-    return _station_statuses.get(station, COLOR_GREY)
+    return _status_snapshot.get(station, COLOR_GREY)
 
 def get_all_statuses():
-    """Returns a copy of the statuses of all stations."""
-    return _station_statuses.copy()
+    """Returns a read-only snapshot of the statuses of all stations; copy it to modify."""
+    return _status_snapshot
+
+# (database.destinations_version(), whether any destination is a cloud destination), or None
+_cloud_destinations = None
+
+def has_cloud_destinations(version):
+    """Returns the cached cloud-destination flag, or None if it was not recorded at this destinations version."""
+    cached = _cloud_destinations
+    if cached is None or cached[0] != version:
+        return None
+    return cached[1]
+
+def update_cloud_destinations(destinations, version):
+    """Records the cloud-destination flag for destination rows listed at the given destinations version."""
+    global _cloud_destinations
+    _cloud_destinations = (version, any(dest[3] in CLOUD_PROVIDERS for dest in destinations))
@@ -1,4 +1,5 @@
 import os
+import shutil
 import logging
 import zipfile # Added for zip functionality
 from .google_drive_connector import GoogleDriveConnector
@@ -7,24 +8,33 @@ from .google_drive_connector import GoogleDriveConnector
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 log = logging.getLogger(__name__)
 
-def create_dummy_zip_file(output_zip_path: str, files_to_zip: list[str]) -> bool:
+COPY_CHUNK_SIZE = 1024 * 1024
+# Test fixtures and outputs live next to this script
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def create_dummy_zip_file(output_zip_path: str, files_to_zip: list[str], compression: int = zipfile.ZIP_STORED) -> bool:
     """
     Creates a zip file containing the specified files.
+    Files are stored uncompressed unless compression (e.g. zipfile.ZIP_DEFLATED) is given.
     Returns True on success, False on failure.
     """
     try:
-        with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(output_zip_path, 'w', compression) as zipf:
             for file_path in files_to_zip:
                 if os.path.exists(file_path):
-                    zipf.write(file_path, os.path.basename(file_path))
-                    log.info(f"Added '{file_path}' to zip file.")
+                    # Stream the file in 1 MiB chunks so memory stays flat however large it is
+                    zinfo = zipfile.ZipInfo.from_file(file_path, os.path.basename(file_path))
+                    zinfo.compress_type = compression
+                    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+                    log.info("Added '%s' to zip file.", file_path)
                 else:
-                    log.warning(f"File not found for zipping: {file_path}")
+                    log.warning("File not found for zipping: %s", file_path)
                     return False
-        log.info(f"Dummy zip file created successfully: {output_zip_path}")
+        log.info("Dummy zip file created successfully: %s", output_zip_path)
         return True
     except Exception as e:
-        log.error(f"Error creating dummy zip file: {e}")
+        log.error("Error creating dummy zip file: %s", e)
         return False
 
 def test_google_drive_upload_and_backup():
@@ -39,19 +49,19 @@ def test_google_drive_upload_and_backup():
 
         # --- Test 1: Regular file upload ---
         local_file_name = "dummy_upload.txt"
-        local_file_path = os.path.join(os.path.dirname(__file__), local_file_name)
+        local_file_path = os.path.join(_MODULE_DIR, local_file_name)
         remote_folder_name_upload = "Gemini_CLI_Test_Uploads" # A specific folder for test uploads
 
         if not os.path.exists(local_file_path):
-            log.error(f"Local file not found: {local_file_path}. Please create it before running this test.")
+            log.error("Local file not found: %s. Please create it before running this test.", local_file_path)
             return
 
-        log.info(f"Attempting to upload '{local_file_name}' to Google Drive folder '{remote_folder_name_upload}'...")
+        log.info("Attempting to upload '%s' to Google Drive folder '%s'...", local_file_name, remote_folder_name_upload)
         file_id = connector.upload_file(local_file_path, remote_folder_name_upload)
 
         if file_id:
-            log.info(f"File uploaded successfully! Remote File ID: {file_id}")
-            log.info(f"Verify in your Google Drive under the folder '{remote_folder_name_upload}'.")
+            log.info("File uploaded successfully! Remote File ID: %s", file_id)
+            log.info("Verify in your Google Drive under the folder '%s'.", remote_folder_name_upload)
         else:
             log.error("Regular file upload failed.")
 
@@ -60,23 +70,26 @@ def test_google_drive_upload_and_backup():
         # --- Test 2: Zip file creation and upload for backup ---
         backup_folder_name = "Gemini_CLI_Backup_Folder"
         output_zip_filename = "dummy_backup.zip"
-        output_zip_path = os.path.join(os.path.dirname(__file__), output_zip_filename)
+        output_zip_path = os.path.join(_MODULE_DIR, output_zip_filename)
         
         files_to_include_in_zip = [local_file_path] # Use the existing dummy_upload.txt
 
-        log.info(f"Attempting to create dummy zip file: {output_zip_filename}...")
+        log.info("Attempting to create dummy zip file: %s...", output_zip_filename)
         if create_dummy_zip_file(output_zip_path, files_to_include_in_zip):
-            log.info(f"Attempting to upload '{output_zip_filename}' to Google Drive folder '{backup_folder_name}'...")
+            log.info("Attempting to upload '%s' to Google Drive folder '%s'...", output_zip_filename, backup_folder_name)
             zip_file_id = connector.upload_file(output_zip_path, backup_folder_name)
 
             if zip_file_id:
-                log.info(f"Zip file uploaded successfully! Remote File ID: {zip_file_id}")
-                log.info(f"Verify in your Google Drive under the folder '{backup_folder_name}'.")
-                # Clean up the local dummy zip file
-                os.remove(output_zip_path)
-                log.info(f"Removed local dummy zip file: {output_zip_path}")
+                log.info("Zip file uploaded successfully! Remote File ID: %s", zip_file_id)
+                log.info("Verify in your Google Drive under the folder '%s'.", backup_folder_name)
             else:
                 log.error("Zip file upload failed.")
+            # Clean up the local dummy zip file whether or not the upload worked
+            try:
+                os.unlink(output_zip_path)
+                log.info("Removed local dummy zip file: %s", output_zip_path)
+            except FileNotFoundError:
+                pass
         else:
             log.error("Failed to create dummy zip file.")
     else:
@@ -1,3 +1,4 @@
+import logging
 import unittest
 from unittest.mock import MagicMock, patch, call
 import threading
@@ -16,6 +17,8 @@ from V6.job_manager import (
     STATUS_COMPLETED, STATUS_FAILED
 )
 
+log = logging.getLogger(__name__)
+
 class TestJobRunner(unittest.TestCase):
 
     @patch('V6.job_runner.database')
@@ -89,9 +92,9 @@ class TestJobRunner(unittest.TestCase):
         # Expected final status written to the database
         expected_db_final_status = STATUS_COMPLETED
         
-        print("\n--- Test Results for Local Job ---")
-        print(f"Expected Job Manager Statuses: {expected_jm_statuses}")
-        print(f"Actual Job Manager Statuses:   {job_manager_statuses}")
+        log.debug("--- Test Results for Local Job ---")
+        log.debug("Expected Job Manager Statuses: %s", expected_jm_statuses)
+        log.debug("Actual Job Manager Statuses:   %s", job_manager_statuses)
         
         # We check that the database was updated to PENDING at the start,
         # and then to its final state.
@@ -159,9 +162,9 @@ class TestJobRunner(unittest.TestCase):
                 STATUS_VERIFYING,
             ]
             
-            print("\n--- Test Results for GDrive Job ---")
-            print(f"Expected Job Manager Statuses: {expected_jm_statuses}")
-            print(f"Actual Job Manager Statuses:   {job_manager_statuses}")
+            log.debug("--- Test Results for GDrive Job ---")
+            log.debug("Expected Job Manager Statuses: %s", expected_jm_statuses)
+            log.debug("Actual Job Manager Statuses:   %s", job_manager_statuses)
 
             self.assertEqual(job_manager_statuses, expected_jm_statuses, "The in-memory job statuses for GDrive job did not transition as expected.")
             
@@ -6,16 +6,17 @@ from . import run_jobs_ui
 from . import destinations_ui
 from . import utilities_ui
 from . import restore_ui
-
-log = logging.getLogger(__name__)
-
 from . import database
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 log = logging.getLogger(__name__)
 
 # --- Test Case Implementations ---
 
+# Seconds the restore search test waits for results before failing
+SEARCH_TIMEOUT = 5.0
+
 def _test_open_window(test_root, window_function, window_name):
     """Helper to test opening a window."""
     try:
@@ -107,10 +108,16 @@ def _test_restore_search(test_root):
         restore_window.search_var.set("test") # A generic search term
         restore_window.perform_search()
         
-        # Give a moment for the search thread to populate
-        time.sleep(0.5) 
-        
-        if restore_window.results_tree.get_children():
+        # Keep the event loop turning until the search has populated the tree
+        deadline = time.monotonic() + SEARCH_TIMEOUT
+        while not restore_window.search_finished.is_set() and time.monotonic() < deadline:
+            test_root.update()
+            restore_window.search_finished.wait(0.01)
+        test_root.update_idletasks()
+
+        if not restore_window.search_finished.is_set():
+            results = {"name": "Restore Window Search", "status": "FAIL", "error": f"Search did not finish within {SEARCH_TIMEOUT} s"}
+        elif restore_window.results_tree.get_children():
             # This is a weak assertion, just checks if any results appeared.
             # A stronger assertion would mock the DB to check for specific results.
             results = {"name": "Restore Window Search", "status": "PASS"}
@@ -126,26 +133,35 @@ def _test_restore_search(test_root):
         return {"name": "Restore Window Search", "status": "FAIL", "error": str(e)}
 
 
-def run_all_tests(root_window):
+def run_all_tests(root_window, include_database_tests=False):
     """
     A generator that yields each test function to be run.
+    Tests that touch Tk are yielded to run on the main thread; tests that don't
+    run concurrently on a thread pool and their results are yielded at the end.
     """
     log.info("Starting UI component tests...")
     
     test_root = tk.Toplevel(root_window)
     test_root.withdraw()
 
+    background_tests = []
+    if include_database_tests:
+        background_tests.append(_test_add_edit_delete_job)
+    executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ui-tests")
+    futures = [executor.submit(test) for test in background_tests]
+
     # Yield test functions
     yield lambda: _test_open_window(test_root, run_jobs_ui.open_run_jobs_window, "Run Jobs Window")
     yield lambda: _test_open_window(test_root, destinations_ui.open_destinations_window, "Create Destinations Window")
-    # For now, we are keeping the test suite small as requested.
-    # To add more tests, we would yield them here.
-    # For example:
-    # yield from (lambda: result for result in _test_add_edit_delete_job())
-    # yield lambda: _test_restore_search(test_root)
+    yield lambda: _test_restore_search(test_root)
+
+    # Collect the background tests; each returns a list of results
+    for future in futures:
+        yield future.result
 
     # This part will be executed after all yielded tests are done
     def finalizer():
+        executor.shutdown(wait=False)
         test_root.destroy()
         log.info("UI component tests finished.")
     yield finalizer
@@ -1,59 +1,143 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import json
-import base64
-from email.message import EmailMessage
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google.auth.exceptions import RefreshError
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-
 import os
 import logging
-import shutil
-import string
+import ctypes
+import time
+from concurrent.futures import ThreadPoolExecutor
 from . import database
 from . import config_utils
 from . import ui_tester
+from .fs_utils import SKIPPED_DIR_NAMES
 
 log = logging.getLogger(__name__)
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.send', 'https://www.googleapis.com/auth/userinfo.email', 'openid', 'https://www.googleapis.com/auth/userinfo.profile']
 
+# Win32 GetDriveTypeW results that aren't worth probing: the letter has no volume, or it's optical media
+_DRIVE_UNKNOWN = 0
+_DRIVE_NO_ROOT_DIR = 1
+_DRIVE_CDROM = 5
+_SKIPPED_DRIVE_TYPES = (_DRIVE_UNKNOWN, _DRIVE_NO_ROOT_DIR, _DRIVE_CDROM)
+
+# Seconds a drive scan is reused, so reopening the selection window doesn't probe the drives again
+DRIVES_CACHE_TTL = 5.0
+_drives_cache = {}  # "drives" -> (scanned_at, drives)
+
+def _scan_local_drives():
+    """Probes only the drive letters Windows reports as present, via kernel32."""
+    if os.name != 'nt':
+        return []
+    kernel32 = ctypes.windll.kernel32
+    mask = kernel32.GetLogicalDrives()
+    drives = []
+    for i in range(26):
+        if not mask & (1 << i):
+            continue
+        drive_path = f"{chr(65 + i)}:\\"
+        if kernel32.GetDriveTypeW(ctypes.c_wchar_p(drive_path)) in _SKIPPED_DRIVE_TYPES:
+            continue
+        free = ctypes.c_ulonglong(0)
+        total = ctypes.c_ulonglong(0)
+        if not kernel32.GetDiskFreeSpaceExW(ctypes.c_wchar_p(drive_path), ctypes.byref(free), ctypes.byref(total), None):
+            continue
+        drives.append({
+            "drive": drive_path,
+            "total_gb": round(total.value / (1024**3)),
+            "free_gb": round(free.value / (1024**3))
+        })
+    return drives
+
 def get_local_drives_info():
     """Scans for local drives and returns their storage information."""
-    drives = []
-    for letter in string.ascii_uppercase:
-        drive_path = f"{letter}:\\"
-        if os.path.exists(drive_path):
-            try:
-                total, used, free = shutil.disk_usage(drive_path)
-                drives.append({
-                    "drive": drive_path,
-                    "total_gb": round(total / (1024**3)),
-                    "free_gb": round(free / (1024**3))
-                })
-            except OSError:
-                continue
+    cached = _drives_cache.get("drives")
+    if cached and time.monotonic() - cached[0] < DRIVES_CACHE_TTL:
+        return cached[1]
+    drives = _scan_local_drives()
+    _drives_cache["drives"] = (time.monotonic(), drives)
     return drives
 
-def get_folder_size(path):
-    """Recursively calculates the total size of all files in a directory."""
+# Upper bound on threads sizing top-level subfolders concurrently; each spends its time blocked in stat calls
+FOLDER_SIZE_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+def _walk_tree_size(path):
+    """Sums the sizes of all files below path with an explicit scandir stack, skipping symlinks and the folders zip_path skips."""
     total_size = 0
-    if not os.path.exists(path):
-        return 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # DirEntry caches the type (and on Windows the size) from the directory listing
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIPPED_DIR_NAMES:
+                                stack.append(entry.path)
+                        else:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total_size
+
+def get_folder_size(path):
+    """
+    Recursively calculates the total size of all files in a directory, skipping symlinks.
+    Top-level subfolders are walked on a thread pool when there is more than one.
+    """
     if os.path.isfile(path):
         return os.path.getsize(path)
-    for dirpath, _, filenames in os.walk(path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            if not os.path.islink(fp):
-                total_size += os.path.getsize(fp)
-    return total_size
+    total_size = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIR_NAMES:
+                            subdirs.append(entry.path)
+                    else:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        return 0
+    if len(subdirs) < 2:
+        return total_size + sum(map(_walk_tree_size, subdirs))
+    with ThreadPoolExecutor(max_workers=min(FOLDER_SIZE_MAX_WORKERS, len(subdirs))) as executor:
+        return total_size + sum(executor.map(_walk_tree_size, subdirs))
+
+LOG_FILE = 'program_execution.log'
+# Lines shown in the Log Viewer tab, and the block size they are read back from the end of the log in
+LOG_TAIL_LINES = 500
+LOG_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Restore history rows fetched per page, and the scroll position (0-1) at which the next page is loaded
+HISTORY_PAGE_SIZE = 200
+HISTORY_LOAD_MORE_AT = 0.95
+
+def read_log_tail(f, max_lines):
+    """Returns the last max_lines lines of a file opened in binary mode, reading backwards in blocks."""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    blocks = []
+    newlines = 0
+    # One newline more than max_lines marks where the first wanted line starts
+    while pos > 0 and newlines <= max_lines:
+        size = min(LOG_TAIL_BLOCK_SIZE, pos)
+        pos -= size
+        f.seek(pos)
+        block = f.read(size)
+        blocks.append(block)
+        newlines += block.count(b'\n')
+    data = b''.join(reversed(blocks))
+    lines = data.splitlines(keepends=True)[-max_lines:]
+    return b''.join(lines).decode('utf-8', errors='replace')
 
 class SelectStagingLocationWindow(tk.Toplevel):
     def __init__(self, parent):
@@ -112,7 +196,8 @@ def open_location_selection_window(parent_window, path_var):
             new_path = os.path.join(selection_window.selected_drive, "System Files Do Not Delete")
             path_var.set(new_path)
             config_utils.save_setting('staging_path', new_path)
-            os.makedirs(new_path, exist_ok=True)
+            if not os.path.isdir(new_path):
+                os.makedirs(new_path, exist_ok=True)
             messagebox.showinfo("Path Set", f"Staging location has been set to:\n{new_path}", parent=parent_window)
     except Exception as e:
         messagebox.showerror("Error Opening Selection Window", f"An unexpected error occurred:\n\n{str(e)}", parent=parent_window)
@@ -121,6 +206,8 @@ def open_location_selection_window(parent_window, path_var):
 
 def open_utilities_window(parent):
     utility_window = tk.Toplevel(parent)
+    # Stay unmapped while the tabs are built, so the window appears once, fully laid out
+    utility_window.withdraw()
     utility_window.title("Utilities")
     utility_window.geometry("800x750")
 
@@ -175,14 +262,33 @@ def open_utilities_window(parent):
     log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     log_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
+    # Byte offset in the log up to which the viewer is current; None forces a full reload
+    log_offset = None
+
     def _load_logs():
+        nonlocal log_offset
         try:
-            with open('program_execution.log', 'r') as f:
-                lines = f.readlines()
-                last_500_lines = lines[-500:]
+            with open(LOG_FILE, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                if log_offset is not None and size >= log_offset:
+                    # Append only what was logged since the last refresh, up to the last complete line
+                    f.seek(log_offset)
+                    new_bytes = f.read(size - log_offset)
+                    new_bytes = new_bytes[:new_bytes.rfind(b'\n') + 1]
+                    if new_bytes:
+                        log_offset += len(new_bytes)
+                        log_text.insert(tk.END, new_bytes.decode('utf-8', errors='replace'))
+                        # Keep the widget at the same number of lines as a full reload would show
+                        log_text.delete('1.0', f'end-{LOG_TAIL_LINES + 1}l')
+                        log_text.see(tk.END)
+                    return
+                # First load, or the log was rotated or truncated
+                tail = read_log_tail(f, LOG_TAIL_LINES)
+                log_offset = size
                 log_text.delete('1.0', tk.END)
-                log_text.insert(tk.END, "".join(last_500_lines))
+                log_text.insert(tk.END, tail)
         except FileNotFoundError:
+            log_offset = None
             log_text.delete('1.0', tk.END)
             log_text.insert(tk.END, "Log file not found.")
 
@@ -207,17 +313,37 @@ def open_utilities_window(parent):
     history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     history_scroll = tk.Scrollbar(history_tree_frame, command=history_tree.yview)
-    history_tree.config(yscrollcommand=history_scroll.set)
     history_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-    def _load_restore_history():
-        for i in history_tree.get_children():
-            history_tree.delete(i)
-        
-        history_data = database.list_restore_history()
+    # Rows loaded so far, whether the last page was full, and the restore_history version they reflect
+    history_state = {"loaded": 0, "has_more": False, "version": None}
+
+    def _load_history_page():
+        history_data = database.list_restore_history(limit=HISTORY_PAGE_SIZE, offset=history_state["loaded"])
         for item in history_data:
             (id, job_name, destination_path, status, start_time, end_time, files_restored) = item
             history_tree.insert("", "end", values=(job_name, destination_path, status, start_time, end_time))
+        history_state["loaded"] += len(history_data)
+        history_state["has_more"] = len(history_data) == HISTORY_PAGE_SIZE
+
+    def _load_restore_history():
+        version = database.restore_history_version()
+        if version == history_state["version"]:
+            return # Nothing was written since the last load
+        history_state.update(loaded=0, version=version)
+        history_tree.delete(*history_tree.get_children())
+        _load_history_page()
+
+    def _on_history_scroll(first, last):
+        history_scroll.set(first, last)
+        # Fetch the next page once the view nears the bottom of what is loaded
+        if history_state["has_more"] and float(last) >= HISTORY_LOAD_MORE_AT:
+            if database.restore_history_version() != history_state["version"]:
+                _load_restore_history() # Offsets shifted under us; start over
+            else:
+                _load_history_page()
+
+    history_tree.config(yscrollcommand=_on_history_scroll)
 
     _load_restore_history()
 
@@ -247,28 +373,27 @@ def open_utilities_window(parent):
     def _populate_test_result(result):
         status = result["status"]
         error = result.get("error", "")
-        item_id = results_tree.insert("", "end", values=(result["name"], status, error))
-        if status == "PASS":
-            results_tree.item(item_id, tags=("pass",))
-        else:
-            results_tree.item(item_id, tags=("fail",))
+        tag = "pass" if status == "PASS" else "fail"
+        results_tree.insert("", "end", values=(result["name"], status, error), tags=(tag,))
 
     def start_tests():
         run_tests_button.config(state=tk.DISABLED, text="Running...")
         # Clear previous results
-        for i in results_tree.get_children():
-            results_tree.delete(i)
+        results_tree.delete(*results_tree.get_children())
             
-        test_generator = ui_tester.run_all_tests(utility_window)
+        test_generator = ui_tester.run_all_tests(utility_window, include_database_tests=True)
 
         def _run_next_test():
             try:
                 test_func = next(test_generator)
                 result = test_func()
-                # The finalizer function will not return a result dict
-                if result:
+                # The finalizer function will not return a result dict; background tests return a list
+                if isinstance(result, list):
+                    for item in result:
+                        _populate_test_result(item)
+                elif result:
                     _populate_test_result(result)
-                utility_window.after(100, _run_next_test) # Schedule the next test
+                utility_window.after_idle(_run_next_test) # Run the next test once pending events are handled
             except StopIteration:
                 # All tests are done
                 run_tests_button.config(state=tk.NORMAL, text="Run UI Tests")
@@ -282,3 +407,6 @@ def open_utilities_window(parent):
     # Add a close button
     close_button = tk.Button(utility_window, text="Close", command=utility_window.destroy)
     close_button.pack(pady=10)
+
+    utility_window.update_idletasks()
+    utility_window.deiconify()
@@ -1,22 +1,39 @@
-"""Ultra-simple console helper for creating ZIP files."""
+"""Command line interface for the FileZipper utility.
+
+Run without arguments for the question-and-answer helper, or pass source paths
+(and options) to create an archive in one go.
+"""
 
 from __future__ import annotations
 
+import argparse
+import sys
 from pathlib import Path
+from typing import Sequence
+
+if __package__ in {None, ""}:  # pragma: no cover - exercised via script execution
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from .zipper import create_zip, make_copy
+from filezipper.zipper import copy_to_locations, create_archive, create_zip, make_copy
 
 
 def _ask(prompt: str) -> str:
     """Read a line of input, returning an empty string when stdin closes."""
 
+    if not sys.stdin.isatty():
+        # Piped input: no line editing to offer, so read the line directly
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        return sys.stdin.readline().rstrip("\n")
     try:
         return input(prompt)
     except EOFError:
         return ""
 
 
-def main() -> int:
+def interactive_main() -> int:
+    """Walk the user through zipping one file or folder with plain questions."""
+
     print("FileZipper: the simple ZIP helper")
     print("---------------------------------")
 
@@ -55,19 +72,7 @@ def main() -> int:
             print("No location provided, skipping the extra copy.")
 
     print("All done. Close this window or press Ctrl+C to exit.")
-"""Command line interface for the FileZipper utility."""
-
-from __future__ import annotations
-
-import argparse
-import sys
-from pathlib import Path
-from typing import Sequence
-
-if __package__ in {None, ""}:  # pragma: no cover - exercised via script execution
-    sys.path.append(str(Path(__file__).resolve().parent.parent))
-
-from filezipper.zipper import copy_to_locations, create_archive
+    return 0
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -90,10 +95,22 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Include hidden files when traversing directories.",
     )
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=range(1, 10),
+        metavar="{1-9}",
+        help="Compression level: 1 is fastest, 9 gives the smallest archive. Defaults to 6.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        return interactive_main()
+
     args = parse_args(argv)
 
     sources = [Path(src) for src in args.sources]
@@ -101,6 +118,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         sources=sources,
         output=Path(args.output) if args.output else None,
         include_hidden=args.include_hidden,
+        compresslevel=args.level,
     )
 
     print(f"Archive created at: {output_path}")
@@ -5,16 +5,18 @@ from __future__ import annotations
 import sys
 import threading
 import tkinter as tk
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Iterable, List
+from typing import Iterable, List, Set
 
 if __package__ in {None, ""}:  # pragma: no cover - exercised via script execution
     sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from filezipper.zipper import copy_to_locations, create_archive
-from .zipper import copy_to_locations, create_archive
+
+# Lines kept in the status area; older lines are dropped as new ones arrive
+STATUS_MAX_LINES = 2000
 
 
 @dataclass
@@ -23,23 +25,33 @@ class SelectionList:
 
     values: List[str]
     listbox: tk.Listbox
+    _seen: Set[str] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._seen.update(self.values)
 
     def add(self, new_values: Iterable[str]) -> None:
+        added = []
         for value in new_values:
             normalized = str(Path(value).expanduser())
-            if normalized not in self.values:
-                self.values.append(normalized)
-                self.listbox.insert(tk.END, normalized)
+            if normalized not in self._seen:
+                self._seen.add(normalized)
+                added.append(normalized)
+        if added:
+            self.values.extend(added)
+            self.listbox.insert(tk.END, *added)
 
     def remove_selected(self) -> None:
         selections = list(self.listbox.curselection())
         for index in reversed(selections):
             self.listbox.delete(index)
+            self._seen.discard(self.values[index])
             del self.values[index]
 
     def clear(self) -> None:
         self.listbox.delete(0, tk.END)
         self.values.clear()
+        self._seen.clear()
 
 
 class FileZipperApp:
@@ -50,9 +62,16 @@ class FileZipperApp:
         root.title("FileZipper")
         root.geometry("720x520")
 
+        # Widgets disabled while a job runs; registered as they are created
+        self._stateful_widgets: List[tk.Widget] = []
+
         self.sources_list = SelectionList([], self._create_listbox("Sources", row=0))
         self.destinations_list = SelectionList([], self._create_listbox("Cloud Destinations", row=2))
 
+        self._pending_log: List[str] = []
+        self._log_flush_scheduled = False
+        self._log_lock = threading.Lock()
+
         self.include_hidden = tk.BooleanVar(value=False)
         self.output_path = tk.StringVar()
 
@@ -80,17 +99,20 @@ class FileZipperApp:
         remove_btn = ttk.Button(frame, text="Remove Selected", command=lambda: self._remove_from_list(listbox))
         remove_btn.grid(row=1, column=2, padx=8, pady=4, sticky="ew")
 
+        self._stateful_widgets.extend((listbox, add_file_btn, add_dir_btn, remove_btn))
+
         return listbox
 
     def _build_controls(self) -> None:
         options_frame = ttk.LabelFrame(self.root, text="Options")
         options_frame.grid(row=1, column=0, padx=12, pady=8, sticky="ew")
 
-        ttk.Checkbutton(
+        hidden_check = ttk.Checkbutton(
             options_frame,
             text="Include hidden files",
             variable=self.include_hidden,
-        ).grid(row=0, column=0, padx=8, pady=6, sticky="w")
+        )
+        hidden_check.grid(row=0, column=0, padx=8, pady=6, sticky="w")
 
         output_label = ttk.Label(options_frame, text="Output path (file or directory):")
         output_label.grid(row=1, column=0, padx=8, pady=(6, 2), sticky="w")
@@ -102,13 +124,20 @@ class FileZipperApp:
         buttons_frame = ttk.Frame(options_frame)
         buttons_frame.grid(row=2, column=1, padx=8, pady=(0, 6))
 
-        ttk.Button(buttons_frame, text="Save As…", command=self._select_output_file).grid(row=0, column=0, padx=(0, 4))
-        ttk.Button(buttons_frame, text="Choose Folder…", command=self._select_output_directory).grid(row=0, column=1, padx=(0, 4))
-        ttk.Button(buttons_frame, text="Clear", command=lambda: self.output_path.set("")).grid(row=0, column=2)
+        save_as_btn = ttk.Button(buttons_frame, text="Save As…", command=self._select_output_file)
+        save_as_btn.grid(row=0, column=0, padx=(0, 4))
+        choose_dir_btn = ttk.Button(buttons_frame, text="Choose Folder…", command=self._select_output_directory)
+        choose_dir_btn.grid(row=0, column=1, padx=(0, 4))
+        clear_btn = ttk.Button(buttons_frame, text="Clear", command=lambda: self.output_path.set(""))
+        clear_btn.grid(row=0, column=2)
 
         self.create_button = ttk.Button(self.root, text="Create Archive", command=self._on_create_clicked)
         self.create_button.grid(row=4, column=0, padx=12, pady=(4, 12), sticky="e")
 
+        self._stateful_widgets.extend(
+            (hidden_check, output_entry, save_as_btn, choose_dir_btn, clear_btn, self.create_button)
+        )
+
     def _build_status_area(self) -> None:
         frame = ttk.LabelFrame(self.root, text="Status")
         frame.grid(row=3, column=0, padx=12, pady=8, sticky="nsew")
@@ -161,8 +190,23 @@ class FileZipperApp:
 
     # --------------------------------------------------------------- status --
     def _log(self, message: str) -> None:
+        # Messages logged in quick succession are written to the widget together on the next idle
+        with self._log_lock:
+            self._pending_log.append(message)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self.root.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        with self._log_lock:
+            messages, self._pending_log = self._pending_log, []
+            self._log_flush_scheduled = False
         self.status_text.configure(state="normal")
-        self.status_text.insert(tk.END, message + "\n")
+        self.status_text.insert(tk.END, "".join(message + "\n" for message in messages))
+        line_count = int(self.status_text.index("end-1c").split(".")[0])
+        if line_count > STATUS_MAX_LINES:
+            self.status_text.delete("1.0", f"{line_count - STATUS_MAX_LINES}.0")
         self.status_text.see(tk.END)
         self.status_text.configure(state="disabled")
 
@@ -202,17 +246,8 @@ class FileZipperApp:
             self._set_controls_state(tk.NORMAL)
 
     def _set_controls_state(self, state: str) -> None:
-        self._set_state_recursive(self.root, state)
-
-    def _set_state_recursive(self, widget: tk.Widget, state: str) -> None:
-        interactive = (ttk.Button, ttk.Checkbutton, ttk.Entry, tk.Listbox)
-        if isinstance(widget, interactive):
-            try:
-                widget.configure(state=state)
-            except tk.TclError:
-                pass
-        for child in widget.winfo_children():
-            self._set_state_recursive(child, state)
+        for widget in self._stateful_widgets:
+            widget.configure(state=state)
 
 
 def main() -> None:
@@ -223,8 +258,6 @@ def main() -> None:
         raise SystemExit(message) from exc
 
     FileZipperApp(root)
-    root = tk.Tk()
-    app = FileZipperApp(root)
     root.mainloop()
 
 
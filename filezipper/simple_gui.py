@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Callable
 
@@ -86,7 +87,8 @@ class _App:
         buttons = self._ttk.Frame(main)
         buttons.grid(row=4, column=0, columnspan=5, sticky="e", padx=10, pady=(15, 5))
 
-        self._ttk.Button(buttons, text="Start", command=self._start).grid(row=0, column=0, padx=(0, 10))
+        self.start_button = self._ttk.Button(buttons, text="Start", command=self._start)
+        self.start_button.grid(row=0, column=0, padx=(0, 10))
         self._ttk.Button(buttons, text="Close", command=self.root.destroy).grid(row=0, column=1)
 
     def _choose_source_file(self) -> None:
@@ -118,26 +120,38 @@ class _App:
         output_text = self.output_var.get().strip()
         copy_text = self.copy_var.get().strip()
 
+        # Zipping runs on a worker thread so the window keeps responding; only one job at a time
+        self.start_button.configure(state="disabled")
+        threading.Thread(target=self._zip_worker, args=(source_text, output_text, copy_text), daemon=True).start()
+
+    def _zip_worker(self, source_text: str, output_text: str, copy_text: str) -> None:
         output_path = Path(output_text) if output_text else None
+        archive = None
+        copied = None
+        error = None
 
         try:
             archive = create_zip(Path(source_text), output_path)
         except FileNotFoundError:
-            self._show_error("FileZipper", "We couldn't find that file or folder. Double-check and try again.")
-            return
+            error = "We couldn't find that file or folder. Double-check and try again."
         except Exception as exc:  # pragma: no cover - defensive guard
-            self._show_error("FileZipper", f"Something went wrong while building the ZIP: {exc}")
-            return
+            error = f"Something went wrong while building the ZIP: {exc}"
 
-        copy_message = ""
-        if copy_text:
+        if archive is not None and copy_text:
             try:
                 copied = make_copy(archive, Path(copy_text))
             except Exception as exc:  # pragma: no cover - defensive guard
-                self._show_error("FileZipper", f"We created the ZIP but couldn't copy it: {exc}")
-                return
-            copy_message = f"\nA backup copy was saved to:\n{copied}"
+                error = f"We created the ZIP but couldn't copy it: {exc}"
+
+        self.root.after(0, self._on_done, archive, copied, error)
+
+    def _on_done(self, archive: Path | None, copied: Path | None, error: str | None) -> None:
+        self.start_button.configure(state="normal")
+        if error:
+            self._show_error("FileZipper", error)
+            return
 
+        copy_message = f"\nA backup copy was saved to:\n{copied}" if copied else ""
         self._show_info("FileZipper", f"All done! Your ZIP lives at:\n{archive}{copy_message}")
 
 
@@ -149,6 +163,8 @@ def launch() -> int:
     except Exception as exc:  # pragma: no cover - defensive guard
         raise RuntimeError("Tkinter could not start a window") from exc
     app = _App(root, tk, ttk, ask_file, ask_dir, show_info, show_error)
+    # Lay the window out before the loop starts, which then sleeps in Tcl until an event arrives
+    root.update_idletasks()
     root.mainloop()
     return app.exit_code
 
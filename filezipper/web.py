@@ -3,17 +3,118 @@
 from __future__ import annotations
 
 import atexit
+import hashlib
 import html
+import os
+import re
+import shutil
 import tempfile
+import threading
+import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List
-from urllib.parse import unquote_plus
-from wsgiref.simple_server import make_server
+from socketserver import ThreadingMixIn
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Sequence, Tuple
+from urllib.parse import parse_qsl
+from wsgiref.simple_server import WSGIServer, make_server
 from wsgiref.util import setup_testing_defaults
 
-from .zipper import copy_to_locations, create_archive
+from .zipper import (
+    ArchiveEntry,
+    _archive_output_path,
+    _gather_entries,
+    _normalize_sources,
+    _write_archive,
+    copy_to_locations,
+    create_archive,
+)
+
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+# The form only carries path lists and options; anything larger is refused unread
+MAX_FORM_BODY = 1024 * 1024
+# Created archives can be downloaded for an hour; expired ones are swept at most every five minutes
+ARCHIVE_TTL = 60 * 60
+SWEEP_INTERVAL = 5 * 60
+# Results kept for download at once; the oldest is forgotten first
+MAX_RESULTS = 1024
+# /download/<token> and /status/<token>; tokens are uuid4 hex, anything else is not routed
+_TOKEN_ROUTE = re.compile(r"/(download|status)/([0-9a-f]{32})")
+# Archives are built in the background, this many at a time; the status page reloads every few seconds
+ARCHIVE_WORKERS = 2
+STATUS_REFRESH_SECONDS = 2
+
+
+def _iter_file(handle: BinaryIO, block_size: int) -> Iterator[bytes]:
+    """Yield *handle* in blocks, closing it when done; used when the server has no file wrapper."""
+
+    with handle:
+        while True:
+            block = handle.read(block_size)
+            if not block:
+                break
+            yield block
+
+
+def _entries_signature(entries: Sequence[ArchiveEntry], include_hidden: bool) -> str:
+    """Hash the source path, name, size and mtime of every file going into an archive."""
+
+    files = [(str(entry.source), entry.arcname, entry.stat.st_size, entry.stat.st_mtime_ns) for entry in entries]
+    key = repr((files, include_hidden)).encode("utf-8")
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+# The page is split so only the body, which varies per request, is formatted and encoded each time
+_PAGE_HEAD = """
+<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8">
+    <title>FileZipper Web</title>
+    <style>
+      body { font-family: system-ui, sans-serif; margin: 2rem; background: #f8f9fa; }
+      form { background: #fff; padding: 1.5rem; border-radius: 0.5rem; box-shadow: 0 1px 3px rgba(0,0,0,0.1); }
+      .field { margin-bottom: 1rem; }
+      label { display: block; font-weight: 600; margin-bottom: 0.4rem; }
+      textarea, input[type=text] { width: 100%; padding: 0.5rem; border: 1px solid #ced4da; border-radius: 0.25rem; }
+      button { background: #0d6efd; color: white; padding: 0.6rem 1.2rem; border: none; border-radius: 0.25rem; cursor: pointer; }
+      button:hover { background: #0b5ed7; }
+      .message { margin-bottom: 1rem; padding: 0.75rem; background: #e7f5ff; border: 1px solid #b6d4fe; border-radius: 0.25rem; }
+      .note { font-size: 0.9rem; color: #6c757d; }
+    </style>
+  </head>
+  <body>
+    <h1>FileZipper Web</h1>
+""".encode("utf-8")
+_PAGE_BODY = """    {message_block}
+    <form method="post">
+      <div class="field">
+        <label for="sources">Source paths</label>
+        <textarea id="sources" name="sources" required placeholder="One path per line">{sources_value}</textarea>
+        <p class="note">Provide files or directories available on the server.</p>
+      </div>
+      <div class="field">
+        <label for="output">Output path (optional)</label>
+        <input id="output" name="output" type="text" value="{output_value}" placeholder="Leave empty to use the app storage directory">
+      </div>
+      <div class="field">
+        <label for="destinations">Copy destinations (optional)</label>
+        <textarea id="destinations" name="destinations" placeholder="One path per line">{destinations_value}</textarea>
+      </div>
+      <div class="field">
+        <label><input type="checkbox" name="include_hidden" {include_hidden_checked}> Include hidden files</label>
+      </div>
+      <button type="submit">Create archive</button>
+    </form>
+    <div>
+      {archive_section}
+      {copies_section}
+    </div>
+"""
+_PAGE_TAIL = """  </body>
+</html>
+""".encode("utf-8")
 
 
 @dataclass
@@ -22,6 +123,16 @@ class ArchiveResult:
 
     archive_path: Path
     copies: List[Path]
+    error: str | None = None
+
+
+@dataclass
+class ArchiveJob:
+    """An archive build that was handed to the background workers."""
+
+    future: Future
+    form_data: Dict[str, str]
+    submitted: float = field(default_factory=time.time)
 
 
 class FileZipperWebApp:
@@ -30,39 +141,99 @@ class FileZipperWebApp:
     def __init__(self) -> None:
         self._storage_dir = Path(tempfile.mkdtemp(prefix="filezipper-web-"))
         self._results: Dict[str, ArchiveResult] = {}
+        self._results_lock = threading.Lock()
+        self._jobs: Dict[str, ArchiveJob] = {}
+        # Source signature -> archive in the storage directory, reused while the sources are unchanged
+        self._archive_cache: Dict[str, Path] = {}
+        # Held while the cache is read or written and while the sweep deletes files
+        self._archive_cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=ARCHIVE_WORKERS, thread_name_prefix="filezipper-archive")
+        self._last_sweep = time.monotonic()
+        # The empty form is the same for every visitor, so it is rendered and encoded once
+        self._index_body = self._render_form().encode("utf-8")
         atexit.register(self._cleanup)
 
     def _cleanup(self) -> None:
-        if self._storage_dir.exists():
-            for item in sorted(self._storage_dir.glob("*")):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self._storage_dir, ignore_errors=True)
+
+    def _sweep_expired(self) -> None:
+        """Forget results older than ``ARCHIVE_TTL`` and delete stale archives from the storage directory."""
+
+        cutoff = time.time() - ARCHIVE_TTL
+        with self._results_lock:
+            for token, info in list(self._results.items()):
                 try:
-                    item.unlink()
+                    expired = info.archive_path.stat().st_mtime < cutoff
                 except OSError:
-                    pass
+                    expired = True
+                if expired:
+                    self._results.pop(token, None)
+        for token, job in list(self._jobs.items()):
+            if job.future.done() and job.submitted < cutoff:
+                self._jobs.pop(token, None)
+
+        # Under the cache lock, so an archive cannot be reused (and touched) while it is being deleted
+        with self._archive_cache_lock:
             try:
-                self._storage_dir.rmdir()
+                with os.scandir(self._storage_dir) as it:
+                    for entry in it:
+                        try:
+                            if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                shutil.rmtree(entry.path, ignore_errors=True)
+                            else:
+                                os.unlink(entry.path)
+                        except OSError:
+                            pass
             except OSError:
                 pass
 
+            for signature, archive_path in list(self._archive_cache.items()):
+                if not archive_path.is_file():
+                    del self._archive_cache[signature]
+
     # ------------------------------------------------------------------
     # WSGI entry point
     # ------------------------------------------------------------------
     def __call__(self, environ, start_response):  # type: ignore[override]
         setup_testing_defaults(environ)
+        if time.monotonic() - self._last_sweep > SWEEP_INTERVAL:
+            self._last_sweep = time.monotonic()
+            self._sweep_expired()
         path = environ.get("PATH_INFO", "")
         method = environ.get("REQUEST_METHOD", "GET").upper()
 
         if path == "/" and method == "GET":
-            return self._respond(start_response, self._render_form())
+            return self._respond(start_response, self._index_body)
 
         if path == "/" and method == "POST":
-            length = int(environ.get("CONTENT_LENGTH") or 0)
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                return self._respond(
+                    start_response,
+                    self._render_form(message="The request had an invalid length."),
+                    status="400 Bad Request",
+                )
+            if length > MAX_FORM_BODY:
+                return self._respond(
+                    start_response,
+                    self._render_form(message="The submitted form is too large."),
+                    status="413 Request Entity Too Large",
+                )
             body = environ["wsgi.input"].read(length)
             return self._handle_submit(body, start_response)
 
-        if path.startswith("/download/") and method == "GET":
-            token = path.split("/", 2)[-1]
-            return self._handle_download(token, start_response)
+        match = _TOKEN_ROUTE.fullmatch(path) if method == "GET" else None
+        if match:
+            route, token = match.groups()
+            if route == "download":
+                return self._handle_download(token, environ, start_response)
+            return self._handle_status(token, start_response)
 
         return self._respond(start_response, self._render_form(message="Not found."), status="404 Not Found")
 
@@ -78,74 +249,134 @@ class FileZipperWebApp:
         output_text = parsed.get("output") or None
         include_hidden = parsed.get("include_hidden") == "on"
 
-        try:
-            if output_text:
-                archive_path = create_archive(sources, output=output_text, include_hidden=include_hidden)
-            else:
-                archive_path = create_archive(sources, output=self._storage_dir, include_hidden=include_hidden)
-        except Exception as exc:  # pragma: no cover - surface errors to UI
-            message = f"Error: {html.escape(str(exc))}"
-            return self._respond(start_response, self._render_form(message=message, form_data=parsed))
+        token = uuid.uuid4().hex
+        future = self._executor.submit(self._build_archive, token, sources, output_text, destinations, include_hidden)
+        self._jobs[token] = ArchiveJob(future=future, form_data=parsed)
+
+        status_url = f"/status/{token}"
+        return self._respond(
+            start_response,
+            self._render_form(message="Creating archive...", status_url=status_url),
+            status="202 Accepted",
+            headers=[("Refresh", f"{STATUS_REFRESH_SECONDS}; url={status_url}")],
+        )
+
+    def _build_archive(
+        self,
+        token: str,
+        sources: Sequence[str],
+        output_text: str | None,
+        destinations: Sequence[str],
+        include_hidden: bool,
+    ) -> None:
+        """Create the archive and its copies; runs on a worker thread."""
+
+        if output_text:
+            archive_path = create_archive(sources, output=output_text, include_hidden=include_hidden)
+        else:
+            # The tree is walked once: the same entries give the cache key and, on a miss, the archive
+            entries = [
+                entry
+                for src in _normalize_sources(list(sources))
+                for entry in _gather_entries(src, include_hidden=include_hidden)
+            ]
+            signature = _entries_signature(entries, include_hidden)
+            with self._archive_cache_lock:
+                archive_path = self._archive_cache.get(signature)
+                if archive_path is not None and archive_path.is_file():
+                    # Keep the reused archive (and its folder) clear of the expiry sweep
+                    os.utime(archive_path)
+                    os.utime(archive_path.parent)
+                else:
+                    archive_path = None
+            if archive_path is None:
+                # One folder per request, so concurrent archives never share a timestamped name
+                archive_path = _archive_output_path(self._storage_dir / token)
+                _write_archive(archive_path, entries)
+                with self._archive_cache_lock:
+                    self._archive_cache[signature] = archive_path
 
         copies: List[Path] = []
+        error = None
         try:
             if destinations:
                 copies = [path for _, path in copy_to_locations(archive_path, destinations)]
         except Exception as exc:  # pragma: no cover - surface errors to UI
-            message = f"Archive created at {html.escape(str(archive_path))}, but copying failed: {html.escape(str(exc))}"
+            error = f"Archive created at {archive_path}, but copying failed: {exc}"
+
+        with self._results_lock:
+            self._results[token] = ArchiveResult(archive_path=archive_path, copies=copies, error=error)
+            # Dicts keep insertion order, so the first key is the oldest result
+            while len(self._results) > MAX_RESULTS:
+                self._results.pop(next(iter(self._results)), None)
+
+    # ------------------------------------------------------------------
+    def _handle_status(self, token: str, start_response):
+        info = self._results.get(token)
+        if info is not None:
+            if info.error:
+                job = self._jobs.get(token)
+                form_data = job.form_data if job else {}
+                content = self._render_form(
+                    message=info.error, form_data=form_data, archive=info.archive_path, copies=info.copies
+                )
+            else:
+                content = self._render_form(
+                    message="Archive created successfully!",
+                    archive=info.archive_path,
+                    copies=info.copies,
+                    token=token,
+                )
+            return self._respond(start_response, content)
+
+        job = self._jobs.get(token)
+        if job is None:
             return self._respond(
-                start_response,
-                self._render_form(message=message, form_data=parsed, archive=archive_path, copies=copies),
+                start_response, self._render_form(message="Archive is no longer available."), status="404 Not Found"
             )
 
-        token = uuid.uuid4().hex
-        self._results[token] = ArchiveResult(archive_path=archive_path, copies=copies)
+        if not job.future.done():
+            status_url = f"/status/{token}"
+            return self._respond(
+                start_response,
+                self._render_form(message="Creating archive...", status_url=status_url),
+                headers=[("Refresh", f"{STATUS_REFRESH_SECONDS}; url={status_url}")],
+            )
 
-        return self._respond(
-            start_response,
-            self._render_form(
-                message="Archive created successfully!",
-                form_data={},
-                archive=archive_path,
-                copies=copies,
-                token=token,
-            ),
-        )
+        exc = job.future.exception()
+        message = f"Error: {exc}" if exc is not None else "Archive is no longer available."
+        return self._respond(start_response, self._render_form(message=message, form_data=job.form_data))
 
     # ------------------------------------------------------------------
-    def _handle_download(self, token: str, start_response):
+    def _handle_download(self, token: str, environ, start_response):
         info = self._results.get(token)
         if not info:
-            return self._respond(start_response, self._render_form(message="Archive is no longer available."))
+            job = self._jobs.get(token)
+            if job is not None and not job.future.done():
+                return self._respond(start_response, self._render_form(message="Archive is not ready yet."))
+            return self._respond(
+                start_response, self._render_form(message="Archive is no longer available."), status="404 Not Found"
+            )
 
         try:
-            data = info.archive_path.read_bytes()
+            handle = info.archive_path.open("rb")
         except OSError:
             return self._respond(start_response, self._render_form(message="Unable to read archive."))
+        size = os.fstat(handle.fileno()).st_size
 
         headers = [
             ("Content-Type", "application/zip"),
-            ("Content-Length", str(len(data))),
+            ("Content-Length", str(size)),
             ("Content-Disposition", f"attachment; filename={info.archive_path.name}"),
         ]
         start_response("200 OK", headers)
-        return [data]
+        # Let the server send the file itself (e.g. via sendfile) when it offers a file wrapper
+        file_wrapper = environ.get("wsgi.file_wrapper", _iter_file)
+        return file_wrapper(handle, DOWNLOAD_BLOCK_SIZE)
 
     # ------------------------------------------------------------------
     def _parse_form(self, body: bytes) -> Dict[str, str]:
-        text = body.decode("utf-8")
-        pairs = text.split("&") if text else []
-        result: Dict[str, str] = {}
-        for pair in pairs:
-            if "=" in pair:
-                key, value = pair.split("=", 1)
-            else:
-                key, value = pair, ""
-            result[self._decode(key)] = self._decode(value)
-        return result
-
-    def _decode(self, value: str) -> str:
-        return unquote_plus(value)
+        return dict(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
 
     def _lines(self, value: str) -> List[str]:
         return [line.strip() for line in value.splitlines() if line.strip()]
@@ -157,14 +388,15 @@ class FileZipperWebApp:
         archive: Path | None = None,
         copies: Iterable[Path] = (),
         token: str | None = None,
+        status_url: str | None = None,
     ) -> str:
-        form_data = form_data or {}
-        sources_value = html.escape(form_data.get("sources", ""))
-        destinations_value = html.escape(form_data.get("destinations", ""))
-        output_value = html.escape(form_data.get("output", ""))
-        include_hidden_checked = "checked" if form_data.get("include_hidden") == "on" else ""
+        escaped = {key: html.escape(value) for key, value in (form_data or {}).items()}
+        sources_value = escaped.get("sources", "")
+        destinations_value = escaped.get("destinations", "")
+        output_value = escaped.get("output", "")
+        include_hidden_checked = "checked" if escaped.get("include_hidden") == "on" else ""
 
-        copies_list = "".join(f"<li>{html.escape(str(path))}</li>" for path in copies)
+        copies_list = "".join([f"<li>{path}</li>" for path in map(html.escape, map(str, copies))])
         copies_section = f"<h3>Copies</h3><ul>{copies_list}</ul>" if copies_list else ""
 
         archive_section = ""
@@ -172,62 +404,34 @@ class FileZipperWebApp:
             archive_section = f"<p>Archive location: {html.escape(str(archive))}</p>"
             if token:
                 archive_section += f'<p><a href="/download/{token}">Download archive</a></p>'
+        elif status_url:
+            archive_section = f'<p><a href="{status_url}">Check progress</a></p>'
 
         message_block = f"<div class='message'>{html.escape(message)}</div>" if message else ""
 
-        return f"""
-<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8">
-    <title>FileZipper Web</title>
-    <style>
-      body {{ font-family: system-ui, sans-serif; margin: 2rem; background: #f8f9fa; }}
-      form {{ background: #fff; padding: 1.5rem; border-radius: 0.5rem; box-shadow: 0 1px 3px rgba(0,0,0,0.1); }}
-      .field {{ margin-bottom: 1rem; }}
-      label {{ display: block; font-weight: 600; margin-bottom: 0.4rem; }}
-      textarea, input[type=text] {{ width: 100%; padding: 0.5rem; border: 1px solid #ced4da; border-radius: 0.25rem; }}
-      button {{ background: #0d6efd; color: white; padding: 0.6rem 1.2rem; border: none; border-radius: 0.25rem; cursor: pointer; }}
-      button:hover {{ background: #0b5ed7; }}
-      .message {{ margin-bottom: 1rem; padding: 0.75rem; background: #e7f5ff; border: 1px solid #b6d4fe; border-radius: 0.25rem; }}
-      .note {{ font-size: 0.9rem; color: #6c757d; }}
-    </style>
-  </head>
-  <body>
-    <h1>FileZipper Web</h1>
-    {message_block}
-    <form method="post">
-      <div class="field">
-        <label for="sources">Source paths</label>
-        <textarea id="sources" name="sources" required placeholder="One path per line">{sources_value}</textarea>
-        <p class="note">Provide files or directories available on the server.</p>
-      </div>
-      <div class="field">
-        <label for="output">Output path (optional)</label>
-        <input id="output" name="output" type="text" value="{output_value}" placeholder="Leave empty to use the app storage directory">
-      </div>
-      <div class="field">
-        <label for="destinations">Copy destinations (optional)</label>
-        <textarea id="destinations" name="destinations" placeholder="One path per line">{destinations_value}</textarea>
-      </div>
-      <div class="field">
-        <label><input type="checkbox" name="include_hidden" {include_hidden_checked}> Include hidden files</label>
-      </div>
-      <button type="submit">Create archive</button>
-    </form>
-    <div>
-      {archive_section}
-      {copies_section}
-    </div>
-  </body>
-</html>
-"""
+        return _PAGE_BODY.format(
+            message_block=message_block,
+            sources_value=sources_value,
+            output_value=output_value,
+            destinations_value=destinations_value,
+            include_hidden_checked=include_hidden_checked,
+            archive_section=archive_section,
+            copies_section=copies_section,
+        )
 
-    def _respond(self, start_response, content: str, status: str = "200 OK"):
-        data = content.encode("utf-8")
-        headers = [("Content-Type", "text/html; charset=utf-8"), ("Content-Length", str(len(data)))]
-        start_response(status, headers)
-        return [data]
+    def _respond(
+        self,
+        start_response,
+        content: str | bytes,
+        status: str = "200 OK",
+        headers: Sequence[Tuple[str, str]] = (),
+    ):
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        length = len(_PAGE_HEAD) + len(data) + len(_PAGE_TAIL)
+        response_headers = [("Content-Type", "text/html; charset=utf-8"), ("Content-Length", str(length))]
+        response_headers.extend(headers)
+        start_response(status, response_headers)
+        return [_PAGE_HEAD, data, _PAGE_TAIL]
 
 
 def create_app() -> FileZipperWebApp:
@@ -236,11 +440,22 @@ def create_app() -> FileZipperWebApp:
     return FileZipperWebApp()
 
 
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server handling each request on its own thread."""
+
+    daemon_threads = True
+
+
 def main() -> None:
-    """Launch the development server."""
+    """Launch the threaded server.
+
+    A long archive job no longer blocks other visitors. For a process-managed
+    deployment run the app under a WSGI server instead, e.g.
+    ``gunicorn -k gthread -w 2 --threads 8 "filezipper.web:create_app()"``.
+    """
 
     app = create_app()
-    with make_server("0.0.0.0", 5000, app) as httpd:
+    with make_server("0.0.0.0", 5000, app, server_class=_ThreadingWSGIServer) as httpd:
         print("Serving on http://0.0.0.0:5000")
         try:
             httpd.serve_forever()
@@ -1,10 +1,43 @@
-"""Tiny helper functions for zipping a folder and dropping a copy elsewhere."""
+"""Core functionality for creating ZIP archives and copying them to destinations.
+
+When the optional ``zlib-ng`` package is installed, importing this module points
+``zipfile.zlib`` and ``zipfile.crc32`` at it for the whole process. zipfile has no
+per-archive hook for its compressor, so every other ``zipfile`` user in the same
+interpreter deflates and checksums with zlib-ng too. The streams are standard
+deflate and CRC-32, so their output stays valid; only the implementation changes.
+"""
 
 from __future__ import annotations
 
+import datetime as _dt
+import os
 import shutil
+import sys
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Iterator, List, Literal, Sequence, Tuple
+
+try:  # Optional: zlib-ng deflates and checksums with SIMD, producing the same streams
+    from zlib_ng import zlib_ng as _zlib_ng
+except ImportError:  # pragma: no cover - optional dependency
+    _zlib_ng = None
+else:
+    # zipfile looks both names up on every call, so this covers create_zip as well.
+    # It is process-wide: other zipfile users get zlib-ng too (see the module docstring).
+    zipfile.zlib = _zlib_ng
+    zipfile.crc32 = _zlib_ng.crc32
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# ioctl that makes the target share the source's extents (btrfs, XFS, bcachefs); blocks are
+# copied only once either file is modified
+FICLONE = 0x40049409
 
 
 def _clean_path(raw: Path) -> Path:
@@ -12,6 +45,96 @@ def _clean_path(raw: Path) -> Path:
     return path.resolve()
 
 
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone *source* into *target* without copying data; ``False`` if the filesystem can't."""
+
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _copy_archive(source: Path, target: Path, mode: Literal["auto", "link", "copy"] = "auto") -> None:
+    """Copy the bytes of *source* to *target* and carry over its timestamps, but no other metadata.
+
+    ``"auto"`` clones the file where the filesystem supports it and copies the
+    bytes otherwise. ``"link"`` makes *target* a hard link to *source* when both
+    live on one filesystem; the two names then share one file, so rewriting
+    the archive in place also changes the "copy". ``"copy"`` always copies.
+    """
+
+    try:
+        same_file = os.path.samefile(source, target)
+    except OSError:
+        same_file = False
+    if same_file:
+        if mode == "link":
+            return  # Linked by an earlier call
+        # Checked before _reflink, whose open() would truncate the source
+        raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+
+    if mode == "link":
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass  # Different filesystem, or the target already exists
+
+    st = os.stat(source)
+    if mode == "copy" or not _reflink(source, target):
+        shutil.copyfile(source, target)
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _sorted_entries(directory: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except PermissionError:
+        return []
+
+
+def _walk_files(root: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(path, relative_path)`` for every file below *root*, depth-first in name order.
+
+    Directories are listed one at a time as the walk reaches them, so files can be
+    written while the rest of the tree is still unvisited. Symlinked directories
+    are not followed.
+    """
+
+    stack = [(iter(_sorted_entries(str(root))), "")]
+    while stack:
+        entries, prefix = stack[-1]
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((iter(_sorted_entries(entry.path)), f"{prefix}{entry.name}/"))
+                break
+            if entry.is_file():
+                yield entry.path, prefix + entry.name
+        else:
+            stack.pop()
+
+
+# Read size for adding a file to the ZIP; ZipFile.write reads 8 KiB at a time
+READ_CHUNK_SIZE = 256 * 1024
+# Write buffer for the ZIP file, so deflate's small outputs reach the OS in large writes
+WRITE_BUFFER_SIZE = 256 * 1024
+# Deflate cannot shrink files this small; they are stored instead
+STORE_BELOW_SIZE = 64
+
+
+def _add_file(zf: zipfile.ZipFile, path: str, arcname: str) -> None:
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zf.compression if zinfo.file_size >= STORE_BELOW_SIZE else zipfile.ZIP_STORED
+    zinfo._compresslevel = zf.compresslevel
+    with open(path, "rb") as src, zf.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, READ_CHUNK_SIZE)
+
+
 def create_zip(source: Path, output: Path | None = None) -> Path:
     """Create a ZIP file containing *source* and return the archive path."""
 
@@ -27,30 +150,34 @@ def create_zip(source: Path, output: Path | None = None) -> Path:
         candidate = Path(output).expanduser()
         if candidate.suffix:
             candidate.parent.mkdir(parents=True, exist_ok=True)
-            archive_path = candidate
+            archive_path = candidate.resolve()
         else:
             destination_dir = _clean_path(candidate)
             destination_dir.mkdir(parents=True, exist_ok=True)
             archive_path = destination_dir / zip_name
 
-    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    with open(archive_path, "wb", buffering=WRITE_BUFFER_SIZE) as fp, zipfile.ZipFile(
+        fp, "w", compression=zipfile.ZIP_DEFLATED
+    ) as zf:
         if src.is_file():
-            zf.write(src, arcname=src.name)
+            _add_file(zf, str(src), src.name)
         else:
             contains_files = False
-            for item in sorted(src.rglob("*")):
-               https://github.com/APZ3r0/FileZipper/pull/6/conflict?name=pyproject.toml&base_oid=0a8012ac3ab31d6bfdc23b3c782a4de6a4e10a5c&head_oid=460ce75c4cbcd866dae3b1ab67795da0949ce38d if item.is_file():
-                    contains_files = True
-                    arcname = item.relative_to(src)
-                    zf.write(item, arcname=str(Path(src.name) / arcname))
+            for file_path, relative in _walk_files(src):
+                contains_files = True
+                _add_file(zf, file_path, f"{src.name}/{relative}")
             if not contains_files:
                 zf.writestr(f"{src.name}/", "")
 
-    return archive_path.resolve()
+    # Every branch above already built the path from a resolved directory
+    return archive_path
 
 
-def make_copy(archive: Path, destination: Path) -> Path:
-    """Copy *archive* to *destination* and return where it landed."""
+def make_copy(archive: Path, destination: Path, mode: Literal["auto", "link", "copy"] = "auto") -> Path:
+    """Copy *archive* to *destination* and return where it landed.
+
+    *mode* picks how the copy is made; see ``_copy_archive``.
+    """
 
     archive_path = _clean_path(archive)
     if not archive_path.exists():
@@ -64,35 +191,38 @@ def make_copy(archive: Path, destination: Path) -> Path:
         target.parent.mkdir(parents=True, exist_ok=True)
         copy_path = target
 
-    shutil.copy2(archive_path, copy_path)
+    _copy_archive(archive_path, copy_path, mode)
     return copy_path.resolve()
 
 
-__all__ = ["create_zip", "make_copy"]
-"""Core functionality for creating ZIP archives and copying them to destinations."""
-
-from __future__ import annotations
-
-import datetime as _dt
-import shutil
-import zipfile
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
-
 
 @dataclass(frozen=True)
 class ArchiveEntry:
-    """Represents a file that will be written to the archive."""
+    """Represents a file that will be written to the archive.
+
+    *source* and *arcname* are plain strings; *arcname* uses ``/`` separators.
+    *stat* is the file's stat result, taken while walking the sources.
+    """
 
-    source: Path
-    arcname: Path
+    source: str
+    arcname: str
+    stat: os.stat_result
 
 
-def _is_hidden(path: Path) -> bool:
-    """Return ``True`` if any part of *path* starts with a dot."""
+# File formats that are compressed already; deflating them again costs CPU and saves next to nothing
+PRECOMPRESSED_SUFFIXES = frozenset(
+    {
+        ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst",
+        ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic",
+        ".mp3", ".aac", ".ogg", ".flac", ".m4a",
+        ".mp4", ".mkv", ".mov", ".avi", ".webm",
+        ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp", ".jar", ".apk",
+    }
+)
 
-    return any(part.startswith(".") for part in path.parts)
+
+def _is_precompressed(arcname: str) -> bool:
+    return os.path.splitext(arcname)[1].lower() in PRECOMPRESSED_SUFFIXES
 
 
 def _normalize_sources(sources: Sequence[Path]) -> List[Path]:
@@ -105,19 +235,90 @@ def _normalize_sources(sources: Sequence[Path]) -> List[Path]:
     return resolved
 
 
+# Subtrees are walked on a thread pool once a source directory has more subdirectories than this
+PARALLEL_WALK_MIN_SUBDIRS = 4
+MAX_WALK_WORKERS = 8
+
+
+def _scan_directory(
+    directory: str, prefix: str, include_hidden: bool
+) -> Tuple[List[Tuple[str, str, os.stat_result]], List[Tuple[str, str]]]:
+    """Return the files (``(path, relative, stat)``) and subdirectories (``(path, relative)``) in *directory*."""
+
+    files: List[Tuple[str, str, os.stat_result]] = []
+    subdirs: List[Tuple[str, str]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not include_hidden and entry.name.startswith("."):
+                    continue
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, relative + "/"))
+                elif entry.is_file():
+                    # On Windows the stat comes with the directory listing, so this costs no extra call
+                    files.append((entry.path, relative, entry.stat()))
+    except PermissionError:
+        pass
+    return files, subdirs
+
+
+def _walk_tree(directory: str, prefix: str, include_hidden: bool) -> List[Tuple[str, str, os.stat_result]]:
+    found: List[Tuple[str, str, os.stat_result]] = []
+    stack = [(directory, prefix)]
+    while stack:
+        files, subdirs = _scan_directory(*stack.pop(), include_hidden)
+        found.extend(files)
+        stack.extend(subdirs)
+    return found
+
+
 def _gather_entries(path: Path, include_hidden: bool) -> Iterable[ArchiveEntry]:
     if path.is_file():
-        yield ArchiveEntry(source=path, arcname=Path(path.name))
+        yield ArchiveEntry(source=str(path), arcname=path.name, stat=path.stat())
         return
 
-    root_name = Path(path.name)
-    for item in sorted(path.rglob("*")):
-        if not item.is_file():
-            continue
-        relative = item.relative_to(path)
-        if not include_hidden and _is_hidden(relative):
-            continue
-        yield ArchiveEntry(source=item, arcname=root_name / relative)
+    # Walk with os.scandir on plain strings; hidden names are pruned before descending
+    found, subdirs = _scan_directory(str(path), "", include_hidden)
+    if len(subdirs) > PARALLEL_WALK_MIN_SUBDIRS:
+        # scandir releases the GIL, so sibling subtrees are listed concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_WALK_WORKERS, len(subdirs))) as executor:
+            futures = [executor.submit(_walk_tree, directory, prefix, include_hidden) for directory, prefix in subdirs]
+            for future in futures:
+                found.extend(future.result())
+    else:
+        for directory, prefix in subdirs:
+            found.extend(_walk_tree(directory, prefix, include_hidden))
+
+    # Same order as sorting the paths: component by component
+    found.sort(key=lambda item: item[1].split("/"))
+    root_name = path.name
+    for source, relative, st in found:
+        yield ArchiveEntry(source=source, arcname=root_name + "/" + relative, stat=st)
+
+
+# Read size for copying a source file into the archive; ZipFile.write uses 8 KiB
+WRITE_CHUNK_SIZE = 1024 * 1024
+# Write buffer for the archive file, so header and central directory records go out in large writes
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+
+
+def _zipinfo_for(entry: ArchiveEntry) -> zipfile.ZipInfo:
+    """Build the entry's ZipInfo as ``ZipInfo.from_file`` would, from the stat taken during the walk."""
+
+    st = entry.stat
+    zinfo = zipfile.ZipInfo(entry.arcname, time.localtime(st.st_mtime)[0:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _write_entry(zf: zipfile.ZipFile, entry: ArchiveEntry, compress_type: int) -> None:
+    zinfo = _zipinfo_for(entry)
+    zinfo.compress_type = compress_type if zinfo.file_size >= STORE_BELOW_SIZE else zipfile.ZIP_STORED
+    zinfo._compresslevel = zf.compresslevel  # As ZipFile.write does; zf.open() reads the level from here
+    with open(entry.source, "rb") as src, zf.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, WRITE_CHUNK_SIZE)
 
 
 def _timestamped_name() -> str:
@@ -125,11 +326,49 @@ def _timestamped_name() -> str:
     return f"archive-{stamp}.zip"
 
 
+def _archive_output_path(output: Path | None) -> Path:
+    """Resolve where create_archive writes, creating the directories it needs."""
+
+    # Resolve the output once: a directory is resolved before the archive name is joined on
+    if output is None:
+        return Path.cwd() / _timestamped_name()
+    candidate = Path(output).expanduser()
+    if candidate.is_dir():
+        return candidate.resolve() / _timestamped_name()
+    if not candidate.exists() and candidate.suffix == "":
+        candidate.mkdir(parents=True, exist_ok=True)
+        return candidate.resolve() / _timestamped_name()
+    candidate.parent.mkdir(parents=True, exist_ok=True)
+    return candidate.resolve()
+
+
+def _write_archive(
+    output_path: Path,
+    entries: Iterable[ArchiveEntry],
+    compression: int = zipfile.ZIP_DEFLATED,
+    compresslevel: int | None = None,
+) -> None:
+    """Write *entries* to a new archive at *output_path*, consuming them as they arrive."""
+
+    archive_name = str(output_path)
+    with open(output_path, "wb", buffering=ARCHIVE_BUFFER_SIZE) as fp, zipfile.ZipFile(
+        fp, "w", compression=compression, allowZip64=True, compresslevel=compresslevel
+    ) as zf:
+        for entry in entries:
+            if entry.source == archive_name:
+                continue  # The archive being written sits inside a source directory
+            if compression != zipfile.ZIP_STORED and _is_precompressed(entry.arcname):
+                _write_entry(zf, entry, zipfile.ZIP_STORED)
+            else:
+                _write_entry(zf, entry, compression)
+
+
 def create_archive(
     sources: Sequence[Path],
     output: Path | None = None,
     include_hidden: bool = False,
     compression: int = zipfile.ZIP_DEFLATED,
+    compresslevel: int | None = None,
 ) -> Path:
     """Create a ZIP archive containing *sources*.
 
@@ -148,7 +387,11 @@ def create_archive(
     compression:
         Compression method to use for the archive. ``zipfile.ZIP_DEFLATED`` is
         used by default, which requires zlib support (available in the Python
-        standard library).
+        standard library). Files whose format is already compressed (see
+        ``PRECOMPRESSED_SUFFIXES``) are always stored as-is.
+    compresslevel:
+        Deflate level from 1 (fastest) to 9 (smallest). ``None`` keeps zlib's
+        default of 6.
 
     Returns
     -------
@@ -160,61 +403,56 @@ def create_archive(
         raise ValueError("At least one source path must be provided.")
 
     normalized = _normalize_sources(list(sources))
+    output_path = _archive_output_path(output)
+    entries = (entry for src in normalized for entry in _gather_entries(src, include_hidden=include_hidden))
+    _write_archive(output_path, entries, compression, compresslevel)
+    return output_path
 
-    if output is None:
-        output_path = Path.cwd() / _timestamped_name()
-    else:
-        candidate = Path(output).expanduser()
-        if candidate.exists() and candidate.is_dir():
-            candidate.mkdir(parents=True, exist_ok=True)
-            output_path = candidate / _timestamped_name()
-        elif not candidate.exists() and candidate.suffix == "":
-            candidate.mkdir(parents=True, exist_ok=True)
-            output_path = candidate / _timestamped_name()
-        else:
-            candidate.parent.mkdir(parents=True, exist_ok=True)
-            output_path = candidate
 
-    output_path = output_path.resolve()
+# Upper bound on concurrent copies in copy_to_locations
+MAX_COPY_WORKERS = 8
 
-    entries: List[ArchiveEntry] = []
-    for src in normalized:
-        if src.is_dir():
-            entries.extend(list(_gather_entries(src, include_hidden=include_hidden)))
-        else:
-            arcname = Path(src.name)
-            entries.append(ArchiveEntry(source=src, arcname=arcname))
 
-    with zipfile.ZipFile(output_path, "w", compression=compression) as zf:
-        for entry in entries:
-            zf.write(entry.source, arcname=str(entry.arcname))
+def _copy_target(archive: Path, dest: Path) -> Path:
+    """Resolve where *archive* lands for *dest*, creating the directories it needs."""
 
-    return output_path
+    target = Path(dest).expanduser()
+    if target.exists() and target.is_file():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        copied_path = target
+    elif not target.exists() and target.suffix:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        copied_path = target
+    else:
+        target.mkdir(parents=True, exist_ok=True)
+        copied_path = target / archive.name
+    return copied_path.resolve()
 
 
 def copy_to_locations(archive_path: Path, destinations: Sequence[Path]) -> List[Tuple[Path, Path]]:
     """Copy *archive_path* to each directory in *destinations*.
 
-    Returns a list of tuples containing ``(destination_directory, copied_file)``.
+    Copies run concurrently, up to ``MAX_COPY_WORKERS`` target files at a time,
+    so slow destinations (network shares, synced folders) overlap instead of
+    queueing.
+
+    Returns a list of tuples containing ``(destination_directory, copied_file)``,
+    in the order of *destinations*.
     """
 
     archive = Path(archive_path).expanduser().resolve()
     if not archive.exists():
         raise FileNotFoundError(f"Archive does not exist: {archive_path}")
 
-    results: List[Tuple[Path, Path]] = []
-    for dest in destinations:
-        target = Path(dest).expanduser()
-        if target.exists() and target.is_file():
-            target.parent.mkdir(parents=True, exist_ok=True)
-            copied_path = target
-        elif not target.exists() and target.suffix:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            copied_path = target
-        else:
-            target.mkdir(parents=True, exist_ok=True)
-            copied_path = target / archive.name
-        copied_path = copied_path.resolve()
-        shutil.copy2(archive, copied_path)
-        results.append((copied_path.parent, copied_path))
-    return results
+    copied_paths = [_copy_target(archive, dest) for dest in destinations]
+    # Destinations resolving to the same file are copied once, never by two threads at a time
+    unique_paths = list(dict.fromkeys(copied_paths))
+    if unique_paths:
+        with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(unique_paths))) as executor:
+            futures = [executor.submit(_copy_archive, archive, path) for path in unique_paths]
+            for future in futures:
+                future.result()
+    return [(copied_path.parent, copied_path) for copied_path in copied_paths]
+
+
+__all__ = ["create_zip", "make_copy", "create_archive", "copy_to_locations"]
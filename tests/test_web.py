@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import io
+import os
+import shutil
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from typing import Dict, List, Tuple
 from urllib.parse import urlencode
 
-from filezipper.web import create_app
+from filezipper.web import MAX_FORM_BODY, create_app
 
 
 def make_request(app, method: str, path: str, body: bytes = b"", headers: Dict[str, str] | None = None):
@@ -33,10 +36,34 @@ def make_request(app, method: str, path: str, body: bytes = b"", headers: Dict[s
     return status[0], response_headers, content
 
 
+def wait_for_status(app, status_path: str, timeout: float = 10) -> bytes:
+    deadline = time.monotonic() + timeout
+    while True:
+        status, headers, body = make_request(app, "GET", status_path)
+        if b"Creating archive" not in body or time.monotonic() > deadline:
+            return body
+        time.sleep(0.01)
+
+
+def submit_form(app, fields: Dict[str, str]) -> bytes:
+    status, headers, body = make_request(app, "POST", "/", body=urlencode(fields).encode("utf-8"))
+    start = body.find(b"/status/")
+    return wait_for_status(app, body[start:].split(b"\"", 1)[0].decode("utf-8"))
+
+
+def archive_location(body: bytes) -> str:
+    return body.split(b"Archive location: ", 1)[1].split(b"</p>", 1)[0].decode("utf-8")
+
+
 class WebAppTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One scratch directory per class, in RAM where the platform offers it
+        cls.scratch_dir = tempfile.mkdtemp(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+        cls.addClassCleanup(shutil.rmtree, cls.scratch_dir, ignore_errors=True)
+
     def setUp(self) -> None:
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.addCleanup(self.temp_dir.cleanup)
+        self.temp_dir = tempfile.mkdtemp(dir=self.scratch_dir)
         self.app = create_app()
 
     def test_index_renders(self) -> None:
@@ -45,7 +72,7 @@ class WebAppTests(unittest.TestCase):
         self.assertIn(b"FileZipper Web", body)
 
     def test_create_archive_and_download(self) -> None:
-        root = Path(self.temp_dir.name)
+        root = Path(self.temp_dir)
         source_dir = root / "data"
         source_dir.mkdir()
         (source_dir / "notes.txt").write_text("meeting notes")
@@ -59,7 +86,13 @@ class WebAppTests(unittest.TestCase):
         ).encode("utf-8")
 
         status, headers, body = make_request(self.app, "POST", "/", body=form)
-        self.assertEqual(status, "200 OK")
+        self.assertEqual(status, "202 Accepted")
+        self.assertIn("Refresh", dict(headers))
+
+        start = body.find(b"/status/")
+        status_path = body[start:].split(b"\"", 1)[0].decode("utf-8")
+
+        body = wait_for_status(self.app, status_path)
         self.assertIn(b"Archive created successfully!", body)
         self.assertIn(b"Download archive", body)
 
@@ -76,6 +109,49 @@ class WebAppTests(unittest.TestCase):
         copied_archive = cloud_dir / archive_name
         self.assertTrue(copied_archive.exists())
 
+    def test_unchanged_sources_reuse_archive(self) -> None:
+        source_dir = Path(self.temp_dir) / "data"
+        source_dir.mkdir()
+        notes = source_dir / "notes.txt"
+        notes.write_text("meeting notes")
+
+        first = archive_location(submit_form(self.app, {"sources": str(source_dir)}))
+        second = archive_location(submit_form(self.app, {"sources": str(source_dir)}))
+        self.assertEqual(first, second)
+
+        notes.write_text("updated meeting notes")
+        third = archive_location(submit_form(self.app, {"sources": str(source_dir)}))
+        self.assertNotEqual(first, third)
+
+    def test_identical_copies_elsewhere_get_their_own_archive(self) -> None:
+        root = Path(self.temp_dir)
+        (root / "a" / "data").mkdir(parents=True)
+        (root / "a" / "data" / "notes.txt").write_text("meeting notes")
+        shutil.copytree(root / "a", root / "b")
+
+        first = archive_location(submit_form(self.app, {"sources": str(root / "a" / "data")}))
+        second = archive_location(submit_form(self.app, {"sources": str(root / "b" / "data")}))
+        self.assertNotEqual(first, second)
+
+    def test_unknown_download_token_is_not_found(self) -> None:
+        status, headers, body = make_request(self.app, "GET", f"/download/{'0' * 32}")
+        self.assertEqual(status, "404 Not Found")
+        self.assertIn(b"no longer available", body)
+
+    def test_oversized_form_is_rejected(self) -> None:
+        body = b"sources=" + b"x" * (MAX_FORM_BODY + 1)
+
+        status, headers, content = make_request(self.app, "POST", "/", body=body)
+        self.assertEqual(status, "413 Request Entity Too Large")
+        self.assertIn(b"too large", content)
+
+    def test_invalid_content_length_is_rejected(self) -> None:
+        for value in ("-1", "abc"):
+            status, headers, content = make_request(
+                self.app, "POST", "/", body=b"sources=x", headers={"CONTENT_LENGTH": value}
+            )
+            self.assertEqual(status, "400 Bad Request")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import os
+import shutil
 import tempfile
+import tkinter as tk
 import unittest
 from unittest import mock
 import zipfile
 from pathlib import Path
 
-from filezipper.zipper import create_zip, make_copy
+from filezipper import cli, gui, zipper
+from filezipper.zipper import copy_to_locations, create_archive, create_zip, make_copy
 
 
 class RunFileZipperTests(unittest.TestCase):
@@ -107,26 +111,15 @@ class FileZipperTests(unittest.TestCase):
                 make_copy(missing, Path(tmp_dir))
 
 
-if __name__ == "__main__":  # pragma: no cover
-import zipfile
-from pathlib import Path
+class ArchiveTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One scratch directory per class, in RAM where the platform offers it
+        cls.scratch_dir = tempfile.mkdtemp(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+        cls.addClassCleanup(shutil.rmtree, cls.scratch_dir, ignore_errors=True)
 
-import unittest
-from unittest import mock
-
-import tkinter as tk
-
-from filezipper.zipper import copy_to_locations, create_archive
-from filezipper import gui
-
-from filezipper.zipper import copy_to_locations, create_archive
-
-
-class FileZipperTests(unittest.TestCase):
     def setUp(self) -> None:
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.addCleanup(self.temp_dir.cleanup)
-        self.root = Path(self.temp_dir.name)
+        self.root = Path(tempfile.mkdtemp(dir=self.scratch_dir))
 
     def _create_structure(self) -> None:
         (self.root / "docs").mkdir()
@@ -144,6 +137,52 @@ class FileZipperTests(unittest.TestCase):
         self.assertIn("docs/notes.txt", names)
         self.assertNotIn("docs/.secret.txt", names)
 
+    def test_create_archive_honours_compresslevel(self) -> None:
+        notes = self.root / "notes.txt"
+        notes.write_text("".join(f"line {i * i % 9973}\n" for i in range(20000)))
+
+        sizes = {}
+        for level in (1, 9):
+            archive = create_archive([notes], output=self.root / f"level-{level}.zip", compresslevel=level)
+            with zipfile.ZipFile(archive) as zf:
+                self.assertEqual(zf.read("notes.txt"), notes.read_bytes())
+                sizes[level] = zf.getinfo("notes.txt").compress_size
+
+        self.assertLess(sizes[9], sizes[1])
+
+    def test_cli_level_is_passed_to_create_archive(self) -> None:
+        with mock.patch("filezipper.cli.create_archive", return_value=self.root / "out.zip") as create, mock.patch(
+            "builtins.print"
+        ):
+            self.assertEqual(cli.main([str(self.root), "--level", "9"]), 0)
+
+        self.assertEqual(create.call_args.kwargs["compresslevel"], 9)
+
+    def test_cli_rejects_level_out_of_range(self) -> None:
+        with mock.patch("filezipper.cli.create_archive") as create, mock.patch("sys.stderr"):
+            with self.assertRaises(SystemExit):
+                cli.main([str(self.root), "--level", "0"])
+
+        create.assert_not_called()
+
+    def test_create_archive_skips_its_own_output(self) -> None:
+        self._create_structure()
+        archive = create_archive([self.root / "docs"], output=self.root / "docs" / "out.zip")
+
+        with zipfile.ZipFile(archive) as zf:
+            self.assertEqual(zf.namelist(), ["docs/notes.txt"])
+
+    def test_precompressed_files_are_stored(self) -> None:
+        payload = b"x" * 4096
+        (self.root / "photo.JPG").write_bytes(payload)
+        (self.root / "notes.txt").write_bytes(payload)
+        archive = create_archive([self.root / "photo.JPG", self.root / "notes.txt"], output=self.root / "out.zip")
+
+        with zipfile.ZipFile(archive) as zf:
+            self.assertEqual(zf.getinfo("photo.JPG").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zf.getinfo("notes.txt").compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zf.read("photo.JPG"), payload)
+
     def test_copy_to_locations_creates_copies(self) -> None:
         (self.root / "sample.txt").write_text("data")
         archive = create_archive([self.root / "sample.txt"], output=self.root / "archive.zip")
@@ -156,6 +195,69 @@ class FileZipperTests(unittest.TestCase):
         self.assertTrue((cloud_a / "archive.zip").exists())
         self.assertTrue((cloud_b / "archive.zip").exists())
 
+    def test_copy_to_locations_copies_repeated_targets_once_in_order(self) -> None:
+        (self.root / "sample.txt").write_text("data")
+        archive = create_archive([self.root / "sample.txt"], output=self.root / "archive.zip")
+        cloud_a = self.root / "cloud-a"
+        cloud_b = self.root / "cloud-b"
+
+        with mock.patch("filezipper.zipper._copy_archive", wraps=zipper._copy_archive) as copy:
+            results = copy_to_locations(archive, [cloud_b, cloud_a, cloud_b])
+
+        self.assertEqual([directory for directory, _ in results], [cloud_b.resolve(), cloud_a.resolve(), cloud_b.resolve()])
+        self.assertEqual(copy.call_count, 2)
+
+    def _archive_with_old_mtime(self) -> Path:
+        (self.root / "sample.txt").write_text("data")
+        archive = create_archive([self.root / "sample.txt"], output=self.root / "archive.zip")
+        os.utime(archive, ns=(1_000_000_000, 1_000_000_000))
+        return archive
+
+    def test_make_copy_link_mode_hard_links(self) -> None:
+        archive = self._archive_with_old_mtime()
+
+        copy_path = make_copy(archive, self.root / "copies", mode="link")
+
+        self.assertTrue(os.path.samefile(archive, copy_path))
+
+    def test_make_copy_copy_mode_writes_a_separate_file(self) -> None:
+        archive = self._archive_with_old_mtime()
+
+        with mock.patch("filezipper.zipper._reflink") as reflink:
+            copy_path = make_copy(archive, self.root / "copies", mode="copy")
+
+        reflink.assert_not_called()
+        self.assertFalse(os.path.samefile(archive, copy_path))
+        self.assertEqual(copy_path.read_bytes(), archive.read_bytes())
+        self.assertEqual(copy_path.stat().st_mtime_ns, 1_000_000_000)
+
+    def test_make_copy_auto_mode_falls_back_to_copying(self) -> None:
+        archive = self._archive_with_old_mtime()
+
+        with mock.patch("filezipper.zipper._reflink", return_value=False) as reflink:
+            copy_path = make_copy(archive, self.root / "copies")
+
+        reflink.assert_called_once()
+        self.assertFalse(os.path.samefile(archive, copy_path))
+        self.assertEqual(copy_path.read_bytes(), archive.read_bytes())
+        self.assertEqual(copy_path.stat().st_mtime_ns, 1_000_000_000)
+
+    def test_make_copy_auto_mode_keeps_a_reflinked_clone(self) -> None:
+        archive = self._archive_with_old_mtime()
+
+        def fake_reflink(source: Path, target: Path) -> bool:
+            shutil.copyfile(source, target)
+            return True
+
+        with mock.patch("filezipper.zipper._reflink", side_effect=fake_reflink), mock.patch(
+            "shutil.copyfile", wraps=shutil.copyfile
+        ) as copyfile:
+            copy_path = make_copy(archive, self.root / "copies", mode="auto")
+
+        self.assertEqual(copyfile.call_count, 1)  # Only the fake clone; no second copy
+        self.assertEqual(copy_path.read_bytes(), archive.read_bytes())
+        self.assertEqual(copy_path.stat().st_mtime_ns, 1_000_000_000)
+
 
 class GuiTests(unittest.TestCase):
     def test_main_exits_cleanly_when_display_unavailable(self) -> None: